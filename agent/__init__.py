@@ -0,0 +1 @@
+"""Gemini ADK FastAPI agent package for the AI Employee control plane."""
@@ -0,0 +1 @@
+"""Mission sub-agents (validation, planning helpers) for the control plane."""
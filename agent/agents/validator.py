@@ -0,0 +1,129 @@
+"""Preflight validation of mission safeguards against connected accounts.
+
+Before a mission executes tools, the validator checks that every requested
+toolkit is connected with the scopes the safeguard demands, and clamps
+rate-limit settings that exceed the tenant ceiling. Failures are surfaced
+through telemetry so the control plane can alert.
+"""
+
+from __future__ import annotations
+
+import functools
+from collections.abc import Sequence
+from dataclasses import dataclass, replace
+from typing import Any
+
+from agent.services.supabase_session import Telemetry
+
+DEFAULT_RATE_LIMIT_CEILING = 60
+
+
+@dataclass(frozen=True)
+class Safeguard:
+    toolkit: str
+    scopes: tuple[str, ...] = ()
+    max_calls_per_minute: int = DEFAULT_RATE_LIMIT_CEILING
+
+
+@dataclass(frozen=True)
+class PreflightResult:
+    ok: bool
+    safeguards: tuple[Safeguard, ...]
+    issues: tuple[dict[str, Any], ...]
+    autofixes: tuple[dict[str, Any], ...]
+
+
+@functools.lru_cache(maxsize=1024)
+def _hydrate_safeguard(frozen: tuple[tuple[str, Any], ...]) -> Safeguard:
+    """Build a Safeguard from a frozen item tuple; repeat shapes hit the cache."""
+    data = dict(frozen)
+    return Safeguard(
+        toolkit=data["toolkit"],
+        scopes=tuple(data.get("scopes", ())),
+        max_calls_per_minute=int(
+            data.get("max_calls_per_minute", DEFAULT_RATE_LIMIT_CEILING)
+        ),
+    )
+
+
+def hydrate_safeguard(raw: dict[str, Any]) -> Safeguard:
+    frozen = tuple(
+        sorted(
+            (key, tuple(value) if isinstance(value, list) else value)
+            for key, value in raw.items()
+        )
+    )
+    return _hydrate_safeguard(frozen)
+
+
+class ValidatorAgent:
+    """Checks mission safeguards before the executor is allowed to run."""
+
+    def __init__(
+        self,
+        composio: Any,
+        *,
+        telemetry: Telemetry | None = None,
+        rate_limit_ceiling: int = DEFAULT_RATE_LIMIT_CEILING,
+    ) -> None:
+        self._composio = composio
+        self._telemetry = telemetry
+        self._rate_limit_ceiling = rate_limit_ceiling
+
+    async def preflight_check(
+        self,
+        *,
+        user_id: str,
+        tenant_id: str,
+        safeguards: Sequence[dict[str, Any]],
+    ) -> PreflightResult:
+        hydrated = [hydrate_safeguard(raw) for raw in safeguards]
+        statuses = await self._composio.connected_accounts_status(user_id, tenant_id)
+        active = {
+            status["toolkit"]: set(status["scopes"])
+            for status in statuses
+            if status["status"] == "active"
+        }
+        issues: list[dict[str, Any]] = []
+        autofixes: list[dict[str, Any]] = []
+        checked: list[Safeguard] = []
+        for safeguard in hydrated:
+            granted = active.get(safeguard.toolkit)
+            if granted is None:
+                issues.append(
+                    {"toolkit": safeguard.toolkit, "issue": "missing_connection"}
+                )
+            else:
+                missing = set(safeguard.scopes) - granted
+                if missing:
+                    issues.append(
+                        {
+                            "toolkit": safeguard.toolkit,
+                            "issue": "missing_scopes",
+                            "scopes": sorted(missing),
+                        }
+                    )
+            if safeguard.max_calls_per_minute > self._rate_limit_ceiling:
+                safeguard = replace(
+                    safeguard, max_calls_per_minute=self._rate_limit_ceiling
+                )
+                autofixes.append(
+                    {
+                        "toolkit": safeguard.toolkit,
+                        "field": "max_calls_per_minute",
+                        "value": self._rate_limit_ceiling,
+                    }
+                )
+            checked.append(safeguard)
+        ok = not issues
+        if not ok and self._telemetry is not None:
+            self._telemetry.emit(
+                "validator.preflight_failed",
+                {"tenant_id": tenant_id, "issues": list(issues)},
+            )
+        return PreflightResult(
+            ok=ok,
+            safeguards=tuple(checked),
+            issues=tuple(issues),
+            autofixes=tuple(autofixes),
+        )
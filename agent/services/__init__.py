@@ -0,0 +1,8 @@
+"""Persistence and telemetry services backing the mission agent."""
+
+from agent.services.supabase_session import (
+    SupabaseSessionService,
+    create_session_service,
+)
+
+__all__ = ["SupabaseSessionService", "create_session_service"]
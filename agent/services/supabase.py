@@ -0,0 +1,180 @@
+"""Thin synchronous Supabase REST client shared by the operational scripts.
+
+Unlike the session service, this module is importable without booting the
+ADK FastAPI stack, so the audit and retention scripts can load it in
+isolation.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import urllib.parse
+import urllib.request
+from typing import Any, ClassVar
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+_shared_client: Any = None
+
+
+def _get_shared_client() -> Any:
+    """Return the process-wide pooled HTTP client, or ``None`` without httpx.
+
+    One keep-alive HTTP/2 pool serves every script call, so paginated audits
+    and retention sweeps pay the TLS handshake once instead of per request.
+    """
+    global _shared_client
+    if _shared_client is None:
+        try:
+            import httpx
+        except ImportError:
+            return None
+        _shared_client = httpx.Client(
+            http2=True,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=4, max_connections=8),
+        )
+    return _shared_client
+
+
+class SupabaseClient:
+    """Minimal PostgREST wrapper for read-mostly script workloads."""
+
+    def __init__(self, url: str, key: str) -> None:
+        self._rest_url = url.rstrip("/") + "/rest/v1"
+        self._headers = {"apikey": key, "Authorization": f"Bearer {key}"}
+
+    @classmethod
+    def from_env(cls) -> SupabaseClient:
+        return cls(
+            os.environ["SUPABASE_URL"], os.environ["SUPABASE_SERVICE_ROLE_KEY"]
+        )
+
+    def _encode_body(
+        self, body: dict[str, Any] | None, headers: dict[str, str]
+    ) -> bytes | None:
+        if body is None:
+            return None
+        headers["Content-Type"] = "application/json"
+        return (
+            orjson.dumps(body)
+            if orjson is not None
+            else json.dumps(body).encode("utf-8")
+        )
+
+    @staticmethod
+    def _decode(raw: bytes) -> Any:
+        if not raw:
+            return None
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, str] | None = None,
+        body: dict[str, Any] | None = None,
+    ) -> Any:
+        url = f"{self._rest_url}{path}"
+        headers = dict(self._headers)
+        data = self._encode_body(body, headers)
+        client = _get_shared_client()
+        if client is not None:
+            response = client.request(
+                method, url, params=params or None, content=data, headers=headers
+            )
+            response.raise_for_status()
+            raw = response.content
+        else:
+            if params:
+                url = f"{url}?{urllib.parse.urlencode(params)}"
+            request = urllib.request.Request(
+                url, data=data, headers=headers, method=method
+            )
+            with urllib.request.urlopen(request, timeout=30) as response:
+                raw = response.read()
+        return self._decode(raw)
+
+    _COUNT_HEADERS: ClassVar[dict[str, str]] = {"Prefer": "count=exact", "Range-Unit": "items", "Range": "0-0"}
+
+    @staticmethod
+    def _parse_content_range(value: str) -> int:
+        total = value.rpartition("/")[2]
+        return int(total) if total.isdigit() else 0
+
+    def count(self, path: str, params: dict[str, str] | None = None) -> int:
+        """Exact row count via a zero-body HEAD probe (``Content-Range`` total)."""
+        headers = {**self._headers, **self._COUNT_HEADERS}
+        url = f"{self._rest_url}{path}"
+        client = _get_shared_client()
+        if client is not None:
+            response = client.request("HEAD", url, params=params or None, headers=headers)
+            response.raise_for_status()
+            return self._parse_content_range(response.headers.get("content-range", ""))
+        if params:
+            url = f"{url}?{urllib.parse.urlencode(params)}"
+        request = urllib.request.Request(url, headers=headers, method="HEAD")
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return self._parse_content_range(response.headers.get("Content-Range", ""))
+
+
+class SupabaseAsyncClient(SupabaseClient):
+    """Async twin of :class:`SupabaseClient` for overlapping independent calls.
+
+    Logically independent REST calls (per-tenant stale queries, multi-table
+    audits) gathered over this client finish in ~max(RTT) wall time instead
+    of sum(RTT).
+    """
+
+    def __init__(self, url: str, key: str) -> None:
+        super().__init__(url, key)
+        self._client: Any = None
+
+    def _ensure_client(self) -> Any:
+        if self._client is None:
+            import httpx
+
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=10.0,
+                limits=httpx.Limits(max_connections=16),
+            )
+        return self._client
+
+    async def _request(  # type: ignore[override]
+        self,
+        method: str,
+        path: str,
+        params: dict[str, str] | None = None,
+        body: dict[str, Any] | None = None,
+    ) -> Any:
+        headers = dict(self._headers)
+        data = self._encode_body(body, headers)
+        response = await self._ensure_client().request(
+            method,
+            f"{self._rest_url}{path}",
+            params=params or None,
+            content=data,
+            headers=headers,
+        )
+        response.raise_for_status()
+        return self._decode(response.content)
+
+    async def count(  # type: ignore[override]
+        self, path: str, params: dict[str, str] | None = None
+    ) -> int:
+        headers = {**self._headers, **self._COUNT_HEADERS}
+        response = await self._ensure_client().request(
+            "HEAD", f"{self._rest_url}{path}", params=params or None, headers=headers
+        )
+        response.raise_for_status()
+        return self._parse_content_range(response.headers.get("content-range", ""))
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
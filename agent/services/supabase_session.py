@@ -0,0 +1,261 @@
+"""Supabase-backed session persistence for the mission agent.
+
+Mission state is buffered in memory (write-behind) and flushed to the
+``mission_sessions`` table on checkpoint, on a heartbeat interval, and on
+shutdown. Failed flushes are queued and retried with exponential backoff so a
+short Supabase outage does not lose mission state.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TABLE = "mission_sessions"
+DEFAULT_HEARTBEAT_SECONDS = 15.0
+DEFAULT_BACKOFF_SECONDS = 5.0
+DEFAULT_MAX_RETRY_BACKOFF = 300.0
+
+_shared_httpx_client: Any = None
+
+
+def _install_uvloop() -> None:
+    """Adopt uvloop's event loop policy when the accelerator is installed.
+
+    The session service is timer-heavy (heartbeat, retry backoff); libuv cuts
+    per-wakeup overhead noticeably versus the default selector loop.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+def _get_shared_httpx_client() -> Any:
+    """Return the process-wide ``httpx.AsyncClient`` shared by Supabase clients.
+
+    Every ``SupabaseSessionService`` reuses this single keep-alive pool so
+    concurrent missions do not pay TCP+TLS setup per REST call and stay inside
+    Supabase's pooler connection limit. Pool sizing is tunable via the
+    ``SUPABASE_POOL_MIN`` / ``SUPABASE_POOL_MAX`` environment variables.
+    """
+    global _shared_httpx_client
+    if _shared_httpx_client is None:
+        import httpx
+
+        _shared_httpx_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_keepalive_connections=int(os.environ.get("SUPABASE_POOL_MIN", "10")),
+                max_connections=int(os.environ.get("SUPABASE_POOL_MAX", "20")),
+            ),
+            http2=True,
+        )
+    return _shared_httpx_client
+
+
+@dataclass(slots=True)
+class RetryEntry:
+    """Book-keeping for one session awaiting a retried flush."""
+
+    attempt: int = 0
+    next_attempt_at: float = 0.0
+
+
+class Telemetry(Protocol):
+    """Minimal telemetry sink used by agent services."""
+
+    def emit(self, event: str, payload: dict[str, Any]) -> None: ...
+
+
+class SupabaseSessionService:
+    """Write-behind session store persisting to the ``mission_sessions`` table.
+
+    ``append_event`` only records the event's state delta in memory; rows are
+    written on :meth:`checkpoint`, on the heartbeat interval, or on
+    :meth:`shutdown`. Flush failures mark the session for retry with
+    exponential backoff.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        table: str = DEFAULT_TABLE,
+        heartbeat_seconds: float = DEFAULT_HEARTBEAT_SECONDS,
+        backoff_seconds: float = DEFAULT_BACKOFF_SECONDS,
+        max_retry_backoff: float = DEFAULT_MAX_RETRY_BACKOFF,
+        telemetry: Telemetry | None = None,
+    ) -> None:
+        self._client = client
+        self._table = table
+        self._heartbeat_seconds = heartbeat_seconds
+        self._backoff_seconds = backoff_seconds
+        self._max_retry_backoff = max_retry_backoff
+        self._telemetry = telemetry
+        self._state: dict[str, dict[str, Any]] = {}
+        self._pending_state: dict[str, dict[str, Any]] = {}
+        self._dirty: set[str] = set()
+        self._retry_queue: dict[str, RetryEntry] = {}
+        self._heartbeat_task: asyncio.Task[None] | None = None
+        self._retry_task: asyncio.Task[None] | None = None
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is not None:
+            self._heartbeat_task = loop.create_task(self._heartbeat_loop())
+            self._retry_task = loop.create_task(self._retry_loop())
+
+    async def append_event(self, session_key: str, event: Any) -> None:
+        """Buffer ``event.actions.state_delta`` without touching Supabase."""
+        if self._heartbeat_task is None:
+            loop = asyncio.get_running_loop()
+            self._heartbeat_task = loop.create_task(self._heartbeat_loop())
+            self._retry_task = loop.create_task(self._retry_loop())
+        # Merge the delta immediately: a key written twice between flushes
+        # serializes once instead of being replayed delta-by-delta.
+        self._pending_state.setdefault(session_key, {}).update(
+            event.actions.state_delta or {}
+        )
+        self._dirty.add(session_key)
+
+    async def checkpoint(self, session_key: str) -> None:
+        """Flush one session's buffered state to Supabase."""
+        await self._flush({session_key})
+
+    async def shutdown(self) -> None:
+        """Stop background tasks and persist any remaining pending writes."""
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            self._heartbeat_task = None
+        if self._retry_task is not None:
+            self._retry_task.cancel()
+            self._retry_task = None
+        self._retry_queue.clear()
+        if not self._dirty:
+            return
+        # One batched upsert: shutdown pays a single round-trip no matter how
+        # many sessions still have pending writes.
+        pending = list(self._dirty)
+        rows = [self._build_row(session_key) for session_key in pending]
+        try:
+            await (
+                self._client.table(self._table)
+                .upsert(rows, on_conflict="session_key")
+                .execute()
+            )
+        except Exception:
+            logger.exception("failed to flush %d sessions on shutdown", len(rows))
+        else:
+            self._dirty.difference_update(pending)
+
+    async def _heartbeat_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._heartbeat_seconds)
+            if self._dirty:
+                await self._flush(set(self._dirty))
+
+    async def _flush(self, session_keys: set[str]) -> None:
+        for session_key in session_keys & self._dirty:
+            row = self._build_row(session_key)
+            try:
+                await (
+                    self._client.table(self._table)
+                    .upsert(row, on_conflict="session_key")
+                    .execute()
+                )
+            except Exception:  # noqa: BLE001 - any failure routes to retry
+                logger.warning("flush failed for session %s; queueing retry", session_key)
+                self._emit("session.retry_queued", {"session_key": session_key})
+                self._schedule_retry(session_key)
+            else:
+                self._dirty.discard(session_key)
+                self._emit("session.flush", {"session_key": session_key})
+
+    def _build_row(self, session_key: str) -> dict[str, Any]:
+        snapshot = self._state.setdefault(session_key, {})
+        snapshot.update(self._pending_state.pop(session_key, {}))
+        return {"session_key": session_key, "state_snapshot": dict(snapshot)}
+
+    def _schedule_retry(self, session_key: str) -> None:
+        entry = self._retry_queue.setdefault(session_key, RetryEntry())
+        entry.next_attempt_at = time.monotonic() + self._backoff_seconds
+
+    async def _retry_loop(self) -> None:
+        """Single shared loop draining every queued retry in one batched upsert.
+
+        One timer serves all pending sessions, so an outage touching N
+        missions costs one wakeup and one request per backoff interval instead
+        of N independent timers and N requests.
+        """
+        while True:
+            await asyncio.sleep(self._backoff_seconds)
+            now = time.monotonic()
+            due = [
+                session_key
+                for session_key, entry in self._retry_queue.items()
+                if entry.next_attempt_at <= now
+            ]
+            for session_key in due:
+                if session_key not in self._dirty:
+                    self._retry_queue.pop(session_key, None)
+            due = [session_key for session_key in due if session_key in self._dirty]
+            if not due:
+                continue
+            rows = [self._build_row(session_key) for session_key in due]
+            try:
+                await (
+                    self._client.table(self._table)
+                    .upsert(rows, on_conflict="session_key")
+                    .execute()
+                )
+            except Exception:  # noqa: BLE001 - any failure extends the backoff
+                for session_key in due:
+                    entry = self._retry_queue[session_key]
+                    entry.attempt += 1
+                    entry.next_attempt_at = now + min(
+                        self._backoff_seconds * 2**entry.attempt,
+                        self._max_retry_backoff,
+                    )
+            else:
+                for session_key in due:
+                    self._retry_queue.pop(session_key, None)
+                    self._dirty.discard(session_key)
+                    self._emit("session.flush", {"session_key": session_key})
+
+    def _emit(self, event: str, payload: dict[str, Any]) -> None:
+        if self._telemetry is not None:
+            self._telemetry.emit(event, payload)
+
+
+async def create_session_service(
+    *,
+    url: str | None = None,
+    key: str | None = None,
+    table: str = DEFAULT_TABLE,
+    telemetry: Telemetry | None = None,
+) -> SupabaseSessionService:
+    """Build a session service against the configured Supabase project.
+
+    The async Supabase client (the service ``await``s every upsert) is
+    constructed on top of the shared pooled httpx transport so every service
+    instance in the process reuses one connection pool instead of opening a
+    fresh one per mission.
+    """
+    from supabase.lib.client_options import AsyncClientOptions
+
+    from supabase import acreate_client
+
+    _install_uvloop()
+    url = url or os.environ["SUPABASE_URL"]
+    key = key or os.environ["SUPABASE_SERVICE_ROLE_KEY"]
+    options = AsyncClientOptions(httpx_client=_get_shared_httpx_client())
+    client = await acreate_client(url, key, options=options)
+    return SupabaseSessionService(client, table=table, telemetry=telemetry)
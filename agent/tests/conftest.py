@@ -0,0 +1,30 @@
+"""Shared test configuration: run the asyncio suites on uvloop when available."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+if uvloop is not None:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_home(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Point XDG caches at a per-test tmp dir.
+
+    The Composio catalog client persists its summary under
+    ``$XDG_CACHE_HOME`` (defaulting to ``~/.cache``); without this the
+    suite leaks files into the developer's home and a stale cache there
+    changes client state across tests.
+    """
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
@@ -0,0 +1,110 @@
+"""Aggregation behaviour of the Gate G-B edit-rate analysis script."""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+_SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "analyze_edit_rates.py"
+_spec = importlib.util.spec_from_file_location("analyze_edit_rates", _SCRIPT)
+assert _spec is not None and _spec.loader is not None
+analyze_edit_rates = importlib.util.module_from_spec(_spec)
+sys.modules["analyze_edit_rates"] = analyze_edit_rates
+_spec.loader.exec_module(analyze_edit_rates)
+
+ROWS = [
+    {
+        "mission_id": "m-1",
+        "persona": "ops",
+        "field": "objective",
+        "accepted": False,
+        "edited": True,
+        "regenerated": True,
+        "confidence": 0.4,
+        "created_at": "2026-08-01T10:00:00Z",
+    },
+    {
+        "mission_id": "m-1",
+        "persona": "ops",
+        "field": "objective",
+        "accepted": True,
+        "edited": False,
+        "regenerated": False,
+        "confidence": 0.9,
+        "created_at": "2026-08-01T10:05:00Z",
+    },
+    {
+        "mission_id": "m-2",
+        "persona": "sales",
+        "field": "objective",
+        "accepted": True,
+        "edited": False,
+        "regenerated": False,
+        "confidence": 0.8,
+        "created_at": "2026-08-02T09:00:00Z",
+    },
+    {
+        "mission_id": "m-2",
+        "persona": "sales",
+        "field": "audience",
+        "accepted": True,
+        "edited": False,
+        "regenerated": False,
+        "confidence": 0.7,
+        "created_at": "2026-08-02T09:01:00Z",
+    },
+]
+
+
+def test_analyze_groups_fields_per_mission() -> None:
+    edit_metrics, persona_metrics, median = analyze_edit_rates.analyze(ROWS)
+    # Regenerated counts per field are [0, 1]; the true median is 0.5.
+    assert median == 0.5
+    by_field = {metrics.field: metrics for metrics in edit_metrics}
+    assert by_field["objective"].total == 2
+    assert by_field["objective"].accepted == 2
+    assert by_field["objective"].edited == 1
+    assert by_field["objective"].regenerated_count == 1
+    assert by_field["audience"].total == 1
+    personas = {metrics.persona: metrics for metrics in persona_metrics}
+    assert personas["ops"].missions == 1
+    assert personas["ops"].edit_rate == 1.0
+    assert personas["sales"].edit_rate == 0.0
+
+
+def test_edit_metrics_from_rpc_matches_local_analysis() -> None:
+    edit_metrics, _, _ = analyze_edit_rates.analyze(ROWS)
+    rpc_rows = [
+        {
+            "field": metrics.field,
+            "total": metrics.total,
+            "accepted": metrics.accepted,
+            "edited": metrics.edited,
+            "regenerated": metrics.regenerated_count,
+            "avg_conf": metrics.avg_confidence,
+        }
+        for metrics in edit_metrics
+    ]
+    assert analyze_edit_rates.edit_metrics_from_rpc(rpc_rows) == edit_metrics
+
+
+def test_build_report_includes_hint_accept_rate() -> None:
+    edit_metrics, persona_metrics, median = analyze_edit_rates.analyze(ROWS)
+    hints = [{"accepted": True}, {"accepted": False}]
+    report = analyze_edit_rates.build_report(edit_metrics, persona_metrics, median, hints)
+    assert report["gate"] == "G-B"
+    assert report["safeguard_hints"]["accept_rate"] == 0.5
+    assert len(report["field_metrics"]) == 2
+
+
+def test_write_report_streams_valid_json() -> None:
+    import json
+    import tempfile
+
+    edit_metrics, persona_metrics, median = analyze_edit_rates.analyze(ROWS)
+    report = analyze_edit_rates.build_report(edit_metrics, persona_metrics, median, [])
+    with tempfile.TemporaryDirectory() as tmp:
+        output = Path(tmp) / "edit_rates.json"
+        analyze_edit_rates.write_report(report, output)
+        assert json.loads(output.read_text(encoding="utf-8")) == report
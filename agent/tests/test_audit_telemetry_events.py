@@ -0,0 +1,165 @@
+"""Keyset pagination and coverage reporting of the telemetry audit script."""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from datetime import datetime, timezone
+from itertools import chain
+from pathlib import Path
+from typing import Any
+
+_SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "audit_telemetry_events.py"
+_spec = importlib.util.spec_from_file_location("audit_telemetry_events", _SCRIPT)
+assert _spec is not None and _spec.loader is not None
+audit_telemetry_events = importlib.util.module_from_spec(_spec)
+sys.modules["audit_telemetry_events"] = audit_telemetry_events
+_spec.loader.exec_module(audit_telemetry_events)
+
+CUTOFF = datetime(2026, 8, 1, tzinfo=timezone.utc)
+
+
+class FakeSupabaseClient:
+    """Replays mission_events rows honouring the script's keyset filters."""
+
+    def __init__(self, rows: list[dict[str, Any]]) -> None:
+        self.rows = rows
+        self.calls: list[dict[str, str]] = []
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, str] | None = None,
+        body: Any = None,
+    ) -> list[dict[str, Any]]:
+        assert method == "GET" and path == "/mission_events"
+        assert params is not None
+        self.calls.append(dict(params))
+        rows = sorted(self.rows, key=lambda row: (row["created_at"], row["id"]))
+        expr = params.get("or")
+        if expr:
+            cursor = expr.split("created_at.gt.", 1)[1].split(",", 1)[0]
+            last_id = int(expr.rsplit("id.gt.", 1)[1].rstrip(")"))
+            rows = [
+                row for row in rows if (row["created_at"], row["id"]) > (cursor, last_id)
+            ]
+        else:
+            cutoff = params["created_at"].removeprefix("gte.")
+            rows = [row for row in rows if row["created_at"] >= cutoff]
+        return rows[: int(params.get("limit", "500"))]
+
+
+def _row(row_id: int, event_name: str, created_at: str) -> dict[str, Any]:
+    return {
+        "id": row_id,
+        "tenant_id": "tenant-1",
+        "mission_id": "mission-1",
+        "event_name": event_name,
+        "payload": {},
+        "created_at": created_at,
+    }
+
+
+def test_iter_events_walks_all_pages() -> None:
+    rows = [
+        _row(index, "mission.created", f"2026-08-0{1 + index // 2}T00:00:00+00:00")
+        for index in range(5)
+    ]
+    client = FakeSupabaseClient(rows)
+    original = audit_telemetry_events.PAGE_SIZE
+    audit_telemetry_events.PAGE_SIZE = 2
+    try:
+        pages = list(audit_telemetry_events._iter_events(client, CUTOFF))
+    finally:
+        audit_telemetry_events.PAGE_SIZE = original
+    fetched = list(chain.from_iterable(pages))
+    assert [row["id"] for row in fetched] == [0, 1, 2, 3, 4]
+    assert len(client.calls) == 3
+    assert "or" in client.calls[1]
+    # Counting runs never ship full rows; nulls are filtered server-side.
+    assert client.calls[0]["select"] == "id,event_name,created_at"
+    assert client.calls[0]["event_name"] == "not.is.null"
+
+
+def test_keyset_cursor_breaks_timestamp_ties() -> None:
+    rows = [_row(index, "planner.started", "2026-08-02T00:00:00+00:00") for index in range(4)]
+    client = FakeSupabaseClient(rows)
+    original = audit_telemetry_events.PAGE_SIZE
+    audit_telemetry_events.PAGE_SIZE = 2
+    try:
+        pages = list(audit_telemetry_events._iter_events(client, CUTOFF))
+    finally:
+        audit_telemetry_events.PAGE_SIZE = original
+    fetched = [row["id"] for row in chain.from_iterable(pages)]
+    assert fetched == [0, 1, 2, 3]
+
+
+def test_fetch_coverage_uses_grouped_rpc() -> None:
+    class RpcClient:
+        def _request(self, method: str, path: str, params: Any = None, body: Any = None):
+            assert method == "POST"
+            assert path == "/rpc/mission_events_required_coverage"
+            assert body["required"] == list(audit_telemetry_events.REQUIRED_EVENTS)
+            return [
+                {"event_name": "mission.created", "cnt": 3},
+                {"event_name": "planner.started", "cnt": 1},
+            ]
+
+    counter = audit_telemetry_events._fetch_coverage(RpcClient(), CUTOFF)
+    assert counter is not None
+    assert counter["mission.created"] == 3
+    assert counter["mission.archived"] == 0
+
+
+def test_fetch_coverage_falls_back_when_rpc_missing() -> None:
+    class FailingClient:
+        def _request(self, method: str, path: str, params: Any = None, body: Any = None):
+            raise OSError("rpc not deployed")
+
+    assert audit_telemetry_events._fetch_coverage(FailingClient(), CUTOFF) is None
+
+
+def test_probe_required_counts_every_event() -> None:
+    import asyncio
+
+    class ProbeClient:
+        def __init__(self) -> None:
+            self.params: list[dict[str, str]] = []
+            self.closed = False
+
+        async def count(self, path: str, params: dict[str, str]) -> int:
+            assert path == "/mission_events"
+            self.params.append(params)
+            return 2 if params["event_name"] == "eq.mission.created" else 0
+
+        async def aclose(self) -> None:
+            self.closed = True
+
+    client = ProbeClient()
+    counter = asyncio.run(audit_telemetry_events._probe_required(client, CUTOFF))
+    assert counter["mission.created"] == 2
+    assert counter["mission.archived"] == 0
+    assert len(client.params) == len(audit_telemetry_events.REQUIRED_EVENTS)
+    assert client.closed
+
+
+def test_print_summary_returns_counter_from_one_pass() -> None:
+    pages = iter(
+        [
+            [
+                _row(1, "mission.created", "2026-08-02T00:00:00+00:00"),
+                _row(2, "mission.created", "2026-08-02T00:01:00+00:00"),
+            ],
+            [_row(3, "planner.started", "2026-08-02T00:02:00+00:00")],
+        ]
+    )
+    counter = audit_telemetry_events._print_summary(pages)
+    assert counter["mission.created"] == 2
+    assert counter["planner.started"] == 1
+
+
+def test_missing_events_reported() -> None:
+    observed = set(audit_telemetry_events.REQUIRED_EVENTS[:-2])
+    missing = audit_telemetry_events._print_missing(observed)
+    assert missing == set(audit_telemetry_events.REQUIRED_EVENTS[-2:])
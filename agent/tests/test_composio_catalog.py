@@ -0,0 +1,199 @@
+"""Parsing, metadata, and live-summary behaviour of the Composio catalog client."""
+
+from __future__ import annotations
+
+import asyncio
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+from agent.tools import composio_client
+from agent.tools.composio_client import ComposioCatalogClient, _parse_catalog
+
+SAMPLE = """# Catalog
+- Gmail: https://docs.composio.dev/toolkits/gmail
+- Slack: https://docs.composio.dev/toolkits/slack
+- Quickstart: https://docs.composio.dev/docs/quickstart
+Plain prose lines are ignored.
+- Bullets without a link are prose too.
+"""
+
+
+def test_parse_catalog_extracts_bullets() -> None:
+    entries = _parse_catalog(SAMPLE)
+    assert [entry.title for entry in entries] == ["Quickstart", "Gmail", "Slack"]
+    assert entries[1].url == "https://docs.composio.dev/toolkits/gmail"
+    assert entries[1].category == "toolkits"
+    assert entries[0].category == "docs"
+
+
+def test_parse_catalog_handles_real_llms_txt() -> None:
+    entries = _parse_catalog(
+        composio_client.CATALOG_SOURCE.read_text(encoding="utf-8")
+    )
+    assert len(entries) >= 15
+    categories = {entry.category for entry in entries}
+    assert {"docs", "sdk_reference", "toolkits"} <= categories
+    titles = {entry.title for entry in entries}
+    assert "Quickstart (authenticated tool calling)" in titles
+    # Multi-URL bullets contribute one entry per labelled segment.
+    assert "Premium tools" in titles
+    assert all(entry.url.startswith("https://") for entry in entries)
+
+
+def test_metadata_summary_and_checksum_stable() -> None:
+    first = ComposioCatalogClient(_parse_catalog(SAMPLE))
+    second = ComposioCatalogClient(_parse_catalog(SAMPLE))
+    assert first.checksum == second.checksum
+    summary = first.metadata["summary"]
+    assert summary["total_entries"] == 3
+    assert summary["categories"] == ["docs", "toolkits"]
+    assert summary["toolkits"] == 2
+
+
+class FakeToolkitsAPI:
+    async def list(self, limit: int, sort_by: str) -> list[SimpleNamespace]:
+        return [
+            SimpleNamespace(
+                name="gmail",
+                meta={
+                    "categories": [{"name": "email"}],
+                    "auth_schemes": ["OAUTH2"],
+                    "description": "Email toolkit",
+                },
+            ),
+            SimpleNamespace(name=None, slug="slack", meta=None),
+        ]
+
+
+class FakeToolsAPI:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, tuple[str, ...], int, str | None]] = []
+        self.fail_for: set[str] = set()
+
+    async def get(
+        self,
+        user_id: str,
+        toolkits: list[str],
+        limit: int,
+        search: str | None = None,
+    ) -> list[Any]:
+        self.calls.append((user_id, tuple(toolkits), limit, search))
+        if self.fail_for.intersection(toolkits):
+            raise ConnectionError("composio unavailable")
+        return [
+            SimpleNamespace(slug=f"{toolkit.upper()}_TOOL", toolkit=toolkit)
+            for toolkit in toolkits
+        ]
+
+
+class FakeComposioSDK:
+    def __init__(self) -> None:
+        self.toolkits = FakeToolkitsAPI()
+        self.tools = FakeToolsAPI()
+
+
+def test_refresh_builds_summary_from_sdk() -> None:
+    client = ComposioCatalogClient([])
+    client._sdk = FakeComposioSDK()
+    summary = asyncio.run(client.refresh())
+    assert [toolkit["name"] for toolkit in summary.toolkits] == ["gmail", "slack"]
+    assert summary.toolkits[0]["auth_schemes"] == ["OAUTH2"]
+    assert summary.categories == ["email"]
+    assert summary.fetched_at > 0
+
+
+def test_get_tools_queries_sdk() -> None:
+    client = ComposioCatalogClient([])
+    sdk = FakeComposioSDK()
+    client._sdk = sdk
+    tools = asyncio.run(client.get_tools(["gmail"]))
+    assert [tool.slug for tool in tools] == ["GMAIL_TOOL"]
+    assert sdk.tools.calls == [("mission-discovery", ("gmail",), 50, None)]
+
+
+def test_get_tools_memoizes_repeat_queries() -> None:
+    client = ComposioCatalogClient([])
+    sdk = FakeComposioSDK()
+    client._sdk = sdk
+
+    async def scenario() -> None:
+        first = await client.get_tools(["gmail"])
+        second = await client.get_tools(["gmail"])
+        assert [tool.slug for tool in second] == [tool.slug for tool in first]
+        assert len(sdk.tools.calls) == 1
+        client.invalidate()
+        await client.get_tools(["gmail"])
+        assert len(sdk.tools.calls) == 2
+
+    asyncio.run(scenario())
+
+
+def test_prefetch_gathers_summary_and_tools() -> None:
+    client = ComposioCatalogClient([])
+    sdk = FakeComposioSDK()
+    sdk.tools.fail_for.add("slack")
+    client._sdk = sdk
+    summary, tools = asyncio.run(client.prefetch(["gmail", "slack"]))
+    assert [toolkit["name"] for toolkit in summary.toolkits] == ["gmail", "slack"]
+    assert [tool.slug for tool in tools["gmail"]] == ["GMAIL_TOOL"]
+    assert tools["slack"] == []
+
+
+def test_batched_get_tools_coalesces_calls() -> None:
+    client = ComposioCatalogClient([])
+    sdk = FakeComposioSDK()
+    client._sdk = sdk
+
+    async def scenario() -> None:
+        gmail_tools, slack_tools = await asyncio.gather(
+            client.get_tools_batched(["gmail"]),
+            client.get_tools_batched(["slack"]),
+        )
+        assert len(sdk.tools.calls) == 1
+        assert sdk.tools.calls[0][1] == ("gmail", "slack")
+        assert [tool.slug for tool in gmail_tools] == ["GMAIL_TOOL"]
+        assert [tool.slug for tool in slack_tools] == ["SLACK_TOOL"]
+
+    asyncio.run(scenario())
+
+
+def test_summary_cache_survives_restart() -> None:
+    import os
+
+    original = os.environ.get("XDG_CACHE_HOME")
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["XDG_CACHE_HOME"] = tmp
+        try:
+            client = ComposioCatalogClient([])
+            client._sdk = FakeComposioSDK()
+            asyncio.run(client.refresh())
+            revived = ComposioCatalogClient([])
+            assert revived._summary is not None
+            assert [toolkit["name"] for toolkit in revived._summary.toolkits] == [
+                "gmail",
+                "slack",
+            ]
+        finally:
+            if original is None:
+                del os.environ["XDG_CACHE_HOME"]
+            else:
+                os.environ["XDG_CACHE_HOME"] = original
+
+
+def test_from_default_cache_memoizes_parse() -> None:
+    original = composio_client.CATALOG_SOURCE
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "llms.txt"
+        path.write_text(SAMPLE, encoding="utf-8")
+        composio_client.CATALOG_SOURCE = path
+        try:
+            first = ComposioCatalogClient.from_default_cache()
+            sidecar = path.with_suffix(".pkl")
+            assert sidecar.exists()
+            second = ComposioCatalogClient.from_default_cache()
+        finally:
+            composio_client.CATALOG_SOURCE = original
+    assert first.checksum == second.checksum
+    assert first.entries == second.entries
@@ -0,0 +1,38 @@
+"""Offline buffering and snapshot dumping of the CopilotKit QA script."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+_SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "test_copilotkit_persistence.py"
+_spec = importlib.util.spec_from_file_location("copilotkit_persistence", _SCRIPT)
+assert _spec is not None and _spec.loader is not None
+copilotkit_persistence = importlib.util.module_from_spec(_spec)
+sys.modules["copilotkit_persistence"] = copilotkit_persistence
+_spec.loader.exec_module(copilotkit_persistence)
+
+
+def test_offline_buffer_captures_exchange() -> None:
+    copilotkit_persistence._offline_buffer.clear()
+    copilotkit_persistence.run_transcript_checks(None)
+    roles = [
+        entry["payload"]["role"] for entry in copilotkit_persistence._offline_buffer
+    ]
+    assert roles == ["user", "assistant"]
+    assert all(
+        entry["table"] == "copilot_messages"
+        for entry in copilotkit_persistence._offline_buffer
+    )
+
+
+def test_snapshot_dump_is_sorted_json() -> None:
+    copilotkit_persistence._offline_buffer.clear()
+    copilotkit_persistence.run_transcript_checks(None)
+    dumped = copilotkit_persistence._dump(copilotkit_persistence.build_snapshot())
+    snapshot = json.loads(dumped)
+    assert snapshot["session_key"] == copilotkit_persistence.SESSION_KEY
+    assert snapshot["message_count"] == 2
+    assert list(snapshot) == sorted(snapshot)
@@ -0,0 +1,35 @@
+"""Hashing and token checks of the foundation readiness generator."""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import sys
+from pathlib import Path
+
+_SCRIPT = (
+    Path(__file__).resolve().parents[2] / "scripts" / "generate_foundation_readiness.py"
+)
+_spec = importlib.util.spec_from_file_location("generate_foundation_readiness", _SCRIPT)
+assert _spec is not None and _spec.loader is not None
+generate_foundation_readiness = importlib.util.module_from_spec(_spec)
+sys.modules["generate_foundation_readiness"] = generate_foundation_readiness
+_spec.loader.exec_module(generate_foundation_readiness)
+
+
+def test_load_reads_once_and_hashes() -> None:
+    digest, data = generate_foundation_readiness._load(
+        generate_foundation_readiness.MIGRATION_FILE
+    )
+    assert digest == hashlib.sha256(data).hexdigest()
+    assert b"mission_sessions" in data
+
+
+def test_build_readiness_reports_rls_and_pgvector() -> None:
+    readiness = generate_foundation_readiness.build_readiness()
+    assert readiness["gate"] == "G-A"
+    assert readiness["pgvector"] is True
+    assert readiness["rls"]
+    assert all(readiness["rls"].values())
+    assert readiness["ready"] is True
+    assert readiness["files"]["migration"]["sha256"]
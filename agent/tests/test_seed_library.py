@@ -0,0 +1,62 @@
+"""Deterministic embeddings and entry construction of the library seeder."""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+from typing import Any
+
+_SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "seed_library.py"
+_spec = importlib.util.spec_from_file_location("seed_library", _SCRIPT)
+assert _spec is not None and _spec.loader is not None
+seed_library = importlib.util.module_from_spec(_spec)
+sys.modules["seed_library"] = seed_library
+_spec.loader.exec_module(seed_library)
+
+
+class FakeSupabaseClient:
+    def __init__(self) -> None:
+        self.inserted: list[dict[str, Any]] = []
+
+    def insert_library_entries(self, entries: Any, batch_size: int = 500) -> int:
+        before = len(self.inserted)
+        self.inserted.extend(entries)
+        return len(self.inserted) - before
+
+
+def test_fake_embedding_is_deterministic() -> None:
+    first = seed_library._fake_embedding("Chase overdue invoices")
+    second = seed_library._fake_embedding("Chase overdue invoices")
+    assert list(first) == list(second)
+    assert len(first) == seed_library.EMBEDDING_DIMENSIONS
+    assert all(-1.0 <= value <= 1.0 for value in first)
+    other = seed_library._fake_embedding("Curate social mentions digest")
+    assert list(first) != list(other)
+
+
+def test_generate_plays_covers_every_persona() -> None:
+    plays = seed_library.generate_plays()
+    assert len(plays) == 25
+    personas = {play.persona for play in plays}
+    assert personas == {"ops", "sales", "support", "finance", "marketing"}
+    assert len({play.title for play in plays}) == 25
+
+
+def test_seed_library_builds_tenant_scoped_entries() -> None:
+    client = FakeSupabaseClient()
+    count = seed_library.seed_library(client, "tenant-1")
+    assert count == 25
+    assert len(client.inserted) == 25
+    entry = client.inserted[0]
+    assert entry["tenant_id"] == "tenant-1"
+    assert len(entry["embedding"]) == seed_library.EMBEDDING_DIMENSIONS
+    assert {"impact", "risk", "undo_plan", "toolkit_hints"} <= entry["metadata"].keys()
+    # Deterministic ids make reruns idempotent upserts.
+    rerun = FakeSupabaseClient()
+    seed_library.seed_library(rerun, "tenant-1")
+    assert rerun.inserted[0]["id"] == entry["id"]
+
+
+def test_seed_library_dry_run_skips_insert() -> None:
+    assert seed_library.seed_library(None, "tenant-1", dry_run=True) == 25
@@ -0,0 +1,57 @@
+"""Schema checksumming and offline buffering of the persistence QA script."""
+
+from __future__ import annotations
+
+import csv
+import importlib.util
+import sys
+import tempfile
+from pathlib import Path
+
+_SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "test_supabase_persistence.py"
+_spec = importlib.util.spec_from_file_location("supabase_persistence", _SCRIPT)
+assert _spec is not None and _spec.loader is not None
+supabase_persistence = importlib.util.module_from_spec(_spec)
+sys.modules["supabase_persistence"] = supabase_persistence
+_spec.loader.exec_module(supabase_persistence)
+
+
+def test_compute_checksums_covers_every_table() -> None:
+    checksums = supabase_persistence.compute_checksums()
+    assert {
+        "mission_sessions",
+        "mission_metadata",
+        "copilot_messages",
+        "mission_events",
+        "library_entries",
+    } <= checksums.keys()
+    assert all(len(digest) == 64 for digest in checksums.values())
+
+
+def test_checksums_ignore_trailing_whitespace() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        plain = Path(tmp) / "plain.sql"
+        padded = Path(tmp) / "padded.sql"
+        plain.write_bytes(b"create table demo (\n    id bigint\n);\n")
+        padded.write_bytes(b"create table demo (\n    id bigint  \n);\n")
+        assert supabase_persistence.compute_checksums(
+            plain
+        ) == supabase_persistence.compute_checksums(padded)
+
+
+def test_write_checksum_csv_sorted_rows() -> None:
+    checksums = {"b_table": "2" * 64, "a_table": "1" * 64}
+    with tempfile.TemporaryDirectory() as tmp:
+        target = Path(tmp) / "artifacts" / "schema_checksums.csv"
+        supabase_persistence.write_checksum_csv(checksums, target)
+        with target.open(newline="") as handle:
+            rows = list(csv.reader(handle))
+    assert rows[0] == ["table", "checksum"]
+    assert [row[0] for row in rows[1:]] == ["a_table", "b_table"]
+
+
+def test_offline_buffer_captures_persistence_rows() -> None:
+    supabase_persistence._offline_buffer.clear()
+    supabase_persistence.run_persistence_checks(None)
+    tables = [entry["table"] for entry in supabase_persistence._offline_buffer]
+    assert tables == ["mission_sessions", "mission_metadata", "mission_events"]
@@ -0,0 +1,304 @@
+"""Async behaviour of the Supabase session service against an in-memory fake."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from types import SimpleNamespace
+from typing import Any
+
+from agent.services.supabase_session import SupabaseSessionService
+
+
+class FakeResult:
+    __slots__ = ("data", "error")
+
+    def __init__(self, data: Any = None, error: Any = None) -> None:
+        self.data = data
+        self.error = error
+
+
+class FakeTable:
+    __slots__ = ("_action", "_client", "_filters", "_payload", "_single")
+
+    def __init__(self, client: FakeSupabaseClient) -> None:
+        self._client = client
+        self._action: str | None = None
+        self._payload: Any = None
+        self._filters: list[tuple[str, Any]] = []
+        self._single = False
+
+    def upsert(self, payload: Any, on_conflict: str | None = None) -> FakeTable:
+        self._action = "upsert"
+        self._payload = payload
+        return self
+
+    def update(self, payload: dict[str, Any]) -> FakeTable:
+        self._action = "update"
+        self._payload = payload
+        return self
+
+    def select(self, columns: str = "*") -> FakeTable:
+        self._action = "select"
+        return self
+
+    def eq(self, column: str, value: Any) -> FakeTable:
+        self._filters.append((column, value))
+        return self
+
+    def maybe_single(self) -> FakeTable:
+        self._single = True
+        return self
+
+    def _matches(self, row: dict[str, Any]) -> bool:
+        return all(row.get(column) == value for column, value in self._filters)
+
+    def _candidate_keys(self) -> list[str]:
+        """Resolve eq filters through the client's index instead of a full scan."""
+        client = self._client
+        if not self._filters:
+            return list(client.rows)
+        # Fast path: rows are keyed by session_key, so the common
+        # primary-key lookup is a single dict probe, no index intersection.
+        if len(self._filters) == 1 and self._filters[0][0] == "session_key":
+            value = self._filters[0][1]
+            return [value] if value in client.rows else []
+        candidates: set[str] | None = None
+        for column, value in self._filters:
+            keys = client._index.get(column, {}).get(value, set())
+            candidates = set(keys) if candidates is None else candidates & keys
+            if not candidates:
+                return []
+        return list(candidates or ())
+
+    async def execute(self) -> FakeResult:
+        # Hot path for every asyncio suite: bind attribute chains to locals
+        # once (LOAD_FAST) instead of re-resolving them per row.
+        client = self._client
+        action = self._action
+        if action == "upsert":
+            if client.raise_on_upsert:
+                raise ConnectionError("supabase unavailable")
+            payload = self._payload
+            payloads = payload if isinstance(payload, list) else [payload]
+            put_row = client.put_row
+            written = [put_row(entry["session_key"], entry) for entry in payloads]
+            client.upsert_count += 1
+            client.write_event.set()
+            client.write_event.clear()
+            return FakeResult(data=written)
+        if action == "update":
+            if client.raise_on_update:
+                raise ConnectionError("supabase unavailable")
+            rows_map = client.rows
+            matches = self._matches
+            put_row = client.put_row
+            payload = self._payload or {}
+            updated = [
+                put_row(key, payload)
+                for key in self._candidate_keys()
+                if matches(rows_map[key])
+            ]
+            client.write_event.set()
+            client.write_event.clear()
+            return FakeResult(data=updated)
+        if action == "select":
+            client.select_count += 1
+            rows_map = client.rows
+            matches = self._matches
+            rows = [
+                row for key in self._candidate_keys() if matches(row := rows_map[key])
+            ]
+            if self._single:
+                return FakeResult(data=rows[0] if rows else None)
+            return FakeResult(data=rows)
+        raise AssertionError(f"unsupported action: {action}")
+
+
+class FakeSupabaseClient:
+    def __init__(self) -> None:
+        self.rows: dict[str, dict[str, Any]] = {}
+        self._index: dict[str, dict[Any, set[str]]] = {}
+        self.raise_on_upsert = False
+        self.raise_on_update = False
+        self.upsert_count = 0
+        self.select_count = 0
+        self.write_event = asyncio.Event()
+
+    def table(self, name: str) -> FakeTable:
+        return FakeTable(self)
+
+    def put_row(self, key: str, payload: dict[str, Any]) -> dict[str, Any]:
+        """Merge ``payload`` into the stored row, keeping eq indexes current."""
+        row = self.rows.get(key)
+        if row is not None:
+            for column, value in row.items():
+                if isinstance(value, (str, int, float, bool, type(None))):
+                    self._index.get(column, {}).get(value, set()).discard(key)
+        else:
+            row = {}
+            self.rows[key] = row
+        row.update(payload)
+        for column, value in row.items():
+            if isinstance(value, (str, int, float, bool, type(None))):
+                self._index.setdefault(column, {}).setdefault(value, set()).add(key)
+        return row
+
+
+class TelemetryStub:
+    __slots__ = ("events",)
+
+    def __init__(self) -> None:
+        self.events: list[tuple[str, dict[str, Any]]] = []
+
+    def emit(self, event: str, payload: dict[str, Any]) -> None:
+        self.events.append((event, payload))
+
+
+def _event(state_delta: dict[str, Any]) -> SimpleNamespace:
+    return SimpleNamespace(actions=SimpleNamespace(state_delta=state_delta))
+
+
+async def _wait_for(
+    client: FakeSupabaseClient, predicate: Callable[[], bool], timeout: float = 2.0
+) -> None:
+    """Wake exactly once per fake write instead of polling on a sleep loop."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            raise AssertionError("condition not met before timeout")
+        try:
+            await asyncio.wait_for(client.write_event.wait(), timeout=remaining)
+        except asyncio.TimeoutError:
+            continue
+
+
+def test_append_event_defers_write_until_checkpoint() -> None:
+    async def scenario() -> None:
+        client = FakeSupabaseClient()
+        service = SupabaseSessionService(
+            client, heartbeat_seconds=60.0, backoff_seconds=0.05
+        )
+        await service.append_event("mission-1", _event({"current_stage": "PLAN"}))
+        await service.append_event("mission-1", _event({"current_stage": "EXECUTE"}))
+        assert client.upsert_count == 0
+        await service.checkpoint("mission-1")
+        assert client.upsert_count == 1
+        assert client.rows["mission-1"]["state_snapshot"]["current_stage"] == "EXECUTE"
+        await service.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_heartbeat_flush_persists_after_interval() -> None:
+    async def scenario() -> None:
+        client = FakeSupabaseClient()
+        telemetry = TelemetryStub()
+        service = SupabaseSessionService(
+            client, heartbeat_seconds=0.05, backoff_seconds=0.05, telemetry=telemetry
+        )
+        await service.append_event("mission-1", _event({"current_stage": "PLAN"}))
+        await _wait_for(client, lambda: "mission-1" in client.rows)
+        assert client.rows["mission-1"]["state_snapshot"]["current_stage"] == "PLAN"
+        assert ("session.flush", {"session_key": "mission-1"}) in telemetry.events
+        await service.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_outage_queue_and_retry() -> None:
+    async def scenario() -> None:
+        client = FakeSupabaseClient()
+        telemetry = TelemetryStub()
+        service = SupabaseSessionService(
+            client, heartbeat_seconds=60.0, backoff_seconds=0.05, telemetry=telemetry
+        )
+        client.raise_on_upsert = True
+        await service.append_event("mission-1", _event({"current_stage": "EXECUTE"}))
+        await service.checkpoint("mission-1")
+        assert "mission-1" not in client.rows
+        assert ("session.retry_queued", {"session_key": "mission-1"}) in telemetry.events
+        client.raise_on_upsert = False
+        await _wait_for(client, lambda: "mission-1" in client.rows)
+        assert client.rows["mission-1"]["state_snapshot"]["current_stage"] == "EXECUTE"
+        await service.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_shutdown_flushes_pending_writes() -> None:
+    async def scenario() -> None:
+        client = FakeSupabaseClient()
+        service = SupabaseSessionService(
+            client, heartbeat_seconds=60.0, backoff_seconds=0.05
+        )
+        await service.append_event("mission-1", _event({"current_stage": "REVIEW"}))
+        await service.append_event("mission-2", _event({"current_stage": "PLAN"}))
+        await service.shutdown()
+        assert client.rows["mission-1"]["state_snapshot"]["current_stage"] == "REVIEW"
+        assert client.rows["mission-2"]["state_snapshot"]["current_stage"] == "PLAN"
+
+    asyncio.run(scenario())
+
+
+def test_create_session_service_wires_async_client() -> None:
+    import sys
+    import types
+
+    from agent.services import supabase_session
+
+    captured: dict[str, Any] = {}
+    fake_client = FakeSupabaseClient()
+    pool_sentinel = object()
+
+    class FakeAsyncClientOptions:
+        def __init__(self, httpx_client: Any = None) -> None:
+            self.httpx_client = httpx_client
+
+    async def fake_acreate_client(url: str, key: str, options: Any = None) -> Any:
+        captured["url"] = url
+        captured["key"] = key
+        captured["options"] = options
+        return fake_client
+
+    supabase_module = types.ModuleType("supabase")
+    supabase_module.acreate_client = fake_acreate_client  # type: ignore[attr-defined]
+    lib_module = types.ModuleType("supabase.lib")
+    options_module = types.ModuleType("supabase.lib.client_options")
+    options_module.AsyncClientOptions = FakeAsyncClientOptions  # type: ignore[attr-defined]
+    saved_modules = {
+        name: sys.modules.get(name)
+        for name in ("supabase", "supabase.lib", "supabase.lib.client_options")
+    }
+    sys.modules["supabase"] = supabase_module
+    sys.modules["supabase.lib"] = lib_module
+    sys.modules["supabase.lib.client_options"] = options_module
+    saved_pool = supabase_session._shared_httpx_client
+    supabase_session._shared_httpx_client = pool_sentinel
+
+    async def scenario() -> None:
+        service = await supabase_session.create_session_service(
+            url="https://example.supabase.co", key="service-key"
+        )
+        assert service._client is fake_client
+        await service.append_event("mission-1", _event({"current_stage": "PLAN"}))
+        await service.checkpoint("mission-1")
+        assert fake_client.rows["mission-1"]["state_snapshot"]["current_stage"] == "PLAN"
+        await service.shutdown()
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        supabase_session._shared_httpx_client = saved_pool
+        for name, module in saved_modules.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
+
+    assert captured["url"] == "https://example.supabase.co"
+    assert captured["key"] == "service-key"
+    assert isinstance(captured["options"], FakeAsyncClientOptions)
+    assert captured["options"].httpx_client is pool_sentinel
@@ -0,0 +1,26 @@
+"""p95 computation of the planner latency validator."""
+
+from __future__ import annotations
+
+import importlib.util
+import statistics
+import sys
+from pathlib import Path
+
+_SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "validate_planner_metrics.py"
+_spec = importlib.util.spec_from_file_location("validate_planner_metrics", _SCRIPT)
+assert _spec is not None and _spec.loader is not None
+validate_planner_metrics = importlib.util.module_from_spec(_spec)
+sys.modules["validate_planner_metrics"] = validate_planner_metrics
+_spec.loader.exec_module(validate_planner_metrics)
+
+
+def test_compute_p95_matches_inclusive_quantiles() -> None:
+    values = [float(v) for v in (120, 340, 90, 2050, 410, 600, 75, 980, 1500, 260)]
+    expected = statistics.quantiles(values, n=100, method="inclusive")[94]
+    assert abs(validate_planner_metrics.compute_p95(values) - expected) < 1e-9
+
+
+def test_compute_p95_handles_edge_cases() -> None:
+    assert validate_planner_metrics.compute_p95([]) == 0.0
+    assert validate_planner_metrics.compute_p95([420.0]) == 420.0
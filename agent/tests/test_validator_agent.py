@@ -0,0 +1,101 @@
+"""Preflight behaviour of the validator agent against a Composio stub."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from agent.agents.validator import ValidatorAgent, _hydrate_safeguard
+
+
+class ComposioStub:
+    __slots__ = ("_response", "calls", "scopes")
+
+    def __init__(self, scopes: dict[str, list[str]]) -> None:
+        self.scopes = scopes
+        self.calls: list[tuple[str, str]] = []
+        # scopes are fixed at construction, so the response is materialized
+        # once instead of N dict allocations per call.
+        self._response = tuple(
+            {"toolkit": toolkit, "scopes": list(granted), "status": "active"}
+            for toolkit, granted in scopes.items()
+        )
+
+    async def connected_accounts_status(
+        self, user_id: str, tenant_id: str
+    ) -> list[dict[str, Any]]:
+        self.calls.append((user_id, tenant_id))
+        return list(self._response)
+
+
+class TelemetryStub:
+    __slots__ = ("events",)
+
+    def __init__(self) -> None:
+        self.events: list[tuple[str, dict[str, Any]]] = []
+
+    def emit(self, event: str, payload: dict[str, Any]) -> None:
+        self.events.append((event, payload))
+
+
+def test_preflight_rate_limit_autofix() -> None:
+    async def scenario() -> None:
+        composio = ComposioStub({"gmail": ["GMAIL_SEND"]})
+        agent = ValidatorAgent(composio, rate_limit_ceiling=60)
+        result = await agent.preflight_check(
+            user_id="user-1",
+            tenant_id="tenant-1",
+            safeguards=[
+                {
+                    "toolkit": "gmail",
+                    "scopes": ["GMAIL_SEND"],
+                    "max_calls_per_minute": 500,
+                }
+            ],
+        )
+        assert result.ok
+        assert result.safeguards[0].max_calls_per_minute == 60
+        assert result.autofixes == (
+            {"toolkit": "gmail", "field": "max_calls_per_minute", "value": 60},
+        )
+        assert composio.calls == [("user-1", "tenant-1")]
+
+    asyncio.run(scenario())
+
+
+def test_preflight_failure_triggers_alert() -> None:
+    async def scenario() -> None:
+        composio = ComposioStub({"slack": ["SLACK_POST"]})
+        telemetry = TelemetryStub()
+        agent = ValidatorAgent(composio, telemetry=telemetry)
+        result = await agent.preflight_check(
+            user_id="user-1",
+            tenant_id="tenant-1",
+            safeguards=[{"toolkit": "gmail", "scopes": ["GMAIL_SEND"]}],
+        )
+        assert not result.ok
+        assert result.issues == (
+            {"toolkit": "gmail", "issue": "missing_connection"},
+        )
+        events = dict(telemetry.events)
+        assert "validator.preflight_failed" in events
+        assert events["validator.preflight_failed"]["tenant_id"] == "tenant-1"
+
+    asyncio.run(scenario())
+
+
+def test_safeguard_hydration_is_memoized() -> None:
+    async def scenario() -> None:
+        composio = ComposioStub({"gmail": ["GMAIL_SEND"]})
+        agent = ValidatorAgent(composio)
+        raw = {"toolkit": "gmail", "scopes": ["GMAIL_SEND"]}
+        before = _hydrate_safeguard.cache_info().hits
+        await agent.preflight_check(
+            user_id="user-1", tenant_id="tenant-1", safeguards=[raw]
+        )
+        await agent.preflight_check(
+            user_id="user-1", tenant_id="tenant-1", safeguards=[dict(raw)]
+        )
+        assert _hydrate_safeguard.cache_info().hits > before
+
+    asyncio.run(scenario())
@@ -0,0 +1,145 @@
+"""Canonical hashing and mismatch reporting of the evidence verifier."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+_SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "verify_artifact_hashes.py"
+_spec = importlib.util.spec_from_file_location("verify_artifact_hashes", _SCRIPT)
+assert _spec is not None and _spec.loader is not None
+verify_artifact_hashes = importlib.util.module_from_spec(_spec)
+sys.modules["verify_artifact_hashes"] = verify_artifact_hashes
+_spec.loader.exec_module(verify_artifact_hashes)
+
+
+def test_hash_payload_is_key_order_independent() -> None:
+    first = verify_artifact_hashes._hash_payload({"b": 1, "a": [1, 2]})
+    second = verify_artifact_hashes._hash_payload({"a": [1, 2], "b": 1})
+    assert first == second
+    assert len(first) == 64
+    assert first != verify_artifact_hashes._hash_payload({"a": [1, 2], "b": 2})
+
+
+def test_hash_payload_matches_canonical_reference() -> None:
+    payload = {"rows": list(range(50_000)), "note": "résumé"}
+    canonical = json.dumps(
+        payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    )
+    import hashlib
+
+    expected = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    assert verify_artifact_hashes._hash_payload(payload) == expected
+
+
+def test_verify_hashes_reports_only_mismatches() -> None:
+    good = {"step": "plan", "output": {"fields": ["objective"]}}
+    bundle = {
+        "artifacts": [
+            {
+                "name": "planner-output",
+                "hash": verify_artifact_hashes._hash_payload(good),
+                "content": good,
+            },
+            {"name": "tampered", "hash": "0" * 64, "content": {"step": "execute"}},
+        ]
+    }
+    mismatches = verify_artifact_hashes.verify_hashes(bundle)
+    assert [entry["name"] for entry in mismatches] == ["tampered"]
+    assert mismatches[0]["stored"] == "0" * 64
+
+
+def test_content_slices_match_parsed_values() -> None:
+    bundle = {
+        "artifacts": [
+            {"name": "a", "hash": "x", "content": {"k": [1, {"content": "nested"}]}},
+            {"name": "b", "hash": "y", "content": "plain text"},
+            {"name": "c", "hash": "z", "content": 12.5},
+        ]
+    }
+    raw = json.dumps(bundle, separators=(",", ":")).encode()
+    slices = verify_artifact_hashes._iter_content_slices(raw)
+    assert [json.loads(piece) for piece in slices] == [
+        artifact["content"] for artifact in bundle["artifacts"]
+    ]
+
+
+def test_verify_hashes_uses_raw_slices_for_canonical_bundles() -> None:
+    content = {"b": 1, "a": "résumé"}
+    bundle = {
+        "artifacts": [
+            {
+                "name": "canonical",
+                "hash": verify_artifact_hashes._hash_payload(content),
+                "content": content,
+            }
+        ]
+    }
+    canonical_raw = json.dumps(
+        bundle, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    ).encode()
+    pretty_raw = json.dumps(bundle, indent=2, ensure_ascii=False).encode()
+    assert verify_artifact_hashes.verify_hashes(bundle, canonical_raw) == []
+    # Non-canonical formatting still verifies via the re-encode fallback.
+    assert verify_artifact_hashes.verify_hashes(bundle, pretty_raw) == []
+
+
+def test_hash_payload_hashes_bytes_directly() -> None:
+    import hashlib
+
+    blob = b"raw artifact bytes"
+    assert (
+        verify_artifact_hashes._hash_payload(blob)
+        == hashlib.sha256(blob).hexdigest()
+    )
+    # Strings stay on the canonical-JSON contract (quotes included) so
+    # they keep matching the raw-slice fast path.
+    assert verify_artifact_hashes._hash_payload("x") == hashlib.sha256(
+        b'"x"'
+    ).hexdigest()
+
+
+def test_content_length_hint_short_circuits_tampered_artifacts() -> None:
+    content = {"step": "plan"}
+    artifact = {
+        "name": "sized",
+        "hash": verify_artifact_hashes._hash_payload(content),
+        "content": content,
+        "content_length": verify_artifact_hashes._canonical_length(content),
+    }
+    bundle = {"artifacts": [artifact]}
+    canonical_raw = json.dumps(
+        bundle, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    ).encode()
+    assert verify_artifact_hashes.verify_hashes(bundle, canonical_raw) == []
+    # Pretty formatting changes slice lengths but not the canonical one.
+    pretty_raw = json.dumps(bundle, indent=2, ensure_ascii=False).encode()
+    assert verify_artifact_hashes.verify_hashes(bundle, pretty_raw) == []
+    # A wrong recorded length is flagged without hashing.
+    artifact["content_length"] += 1
+    mismatches = verify_artifact_hashes.verify_hashes(bundle, canonical_raw)
+    assert [entry["name"] for entry in mismatches] == ["sized"]
+    assert "content_length" in mismatches[0]["calculated"]
+
+
+def test_main_round_trip() -> None:
+    content = {"evidence": "ok"}
+    bundle = {
+        "artifacts": [
+            {
+                "name": "a",
+                "hash": verify_artifact_hashes._hash_payload(content),
+                "content": content,
+            }
+        ]
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "evidence.json"
+        path.write_text(json.dumps(bundle))
+        assert verify_artifact_hashes.main(["--bundle", str(path)]) == 0
+        bundle["artifacts"][0]["hash"] = "f" * 64
+        path.write_text(json.dumps(bundle))
+        assert verify_artifact_hashes.main(["--bundle", str(path)]) == 1
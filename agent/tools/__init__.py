@@ -0,0 +1 @@
+"""Tooling integrations (Composio catalog and SDK access) for the agent."""
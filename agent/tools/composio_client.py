@@ -0,0 +1,577 @@
+"""Composio catalog access for planner prompts and mission tooling.
+
+The static catalog is distilled from ``libs_docs/composio/llms.txt``; bullets
+of the form ``- title: https://...`` become :class:`CatalogEntry` records
+that planners embed into prompts. The live catalog (toolkit summary
+and tool search) is fetched through the async Composio SDK so refreshes never
+block the event loop. Run ``python -m agent.tools.composio_client --status``
+to inspect the parsed catalog, or ``--refresh`` to pull the live summary.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+import os
+import pickle
+import re
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import asdict, astuple, dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    orjson = None  # type: ignore[assignment]
+
+
+def _canonical_dumps(obj: Any) -> bytes:
+    """Key-sorted JSON bytes via orjson, falling back to stdlib json."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+CATALOG_SOURCE = (
+    Path(__file__).resolve().parents[2] / "libs_docs" / "composio" / "llms.txt"
+)
+
+SUMMARY_CACHE_TTL_SECONDS = 3600.0
+TOOLS_CACHE_TTL_SECONDS = 300.0
+TOOLS_CACHE_MAX_ENTRIES = 256
+
+
+_http_client: Any = None
+
+
+def _get_shared_http_client() -> Any:
+    """Process-wide HTTP/2 httpx client backing every Composio SDK instance.
+
+    One keep-alive pool amortizes the TLS handshake across calls and lets
+    concurrent gathers multiplex on a single connection.
+    """
+    global _http_client
+    if _http_client is None:
+        import httpx
+
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+        )
+    return _http_client
+
+
+def _summary_cache_path(api_key: str | None) -> Path:
+    digest = hashlib.sha256((api_key or "anonymous").encode("utf-8")).hexdigest()[:16]
+    cache_root = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    return cache_root / "ai_employee" / f"composio_catalog_{digest}.json"
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    title: str
+    url: str
+    description: str
+    category: str
+
+
+@dataclass(slots=True, frozen=True)
+class CatalogSummary:
+    toolkits: list[dict[str, Any]]
+    categories: list[str]
+    fetched_at: float
+
+
+_CAT_RE = re.compile(r"^https?://[^/]+/([^/]+)")
+_DASH_TO_UNDERSCORE = str.maketrans("-", "_")
+
+
+def _derive_category(url: str) -> str:
+    match = _CAT_RE.match(url)
+    if match is None:
+        return "general"
+    return match.group(1).translate(_DASH_TO_UNDERSCORE)
+
+
+_URL_RE = re.compile(r"https?://\S+")
+
+
+def _parse_catalog(text: str) -> list[CatalogEntry]:
+    # ``- title: https://...`` bullets, the style llms.txt actually uses.
+    # A bullet may carry several ``label: URL`` segments separated by ``|``
+    # (e.g. the API and Pricing lines); each segment becomes an entry.
+    # Bullets without a URL are prose and are skipped.
+    entries: list[CatalogEntry] = []
+    for line in text.splitlines():
+        stripped = line.lstrip()
+        if not stripped.startswith("- "):
+            continue
+        for segment in stripped[2:].split(" | "):
+            match = _URL_RE.search(segment)
+            if match is None:
+                continue
+            title = segment[: match.start()].strip().rstrip(":").rstrip("` ")
+            if not title:
+                continue
+            url = match.group(0).rstrip(".,;)`")
+            entries.append(
+                CatalogEntry(
+                    title=title,
+                    url=url,
+                    description=segment[match.end() :].strip(),
+                    category=_derive_category(url),
+                )
+            )
+    entries.sort(key=lambda entry: (entry.category, entry.title))
+    return entries
+
+
+@functools.singledispatch
+def _to_dict(record: Any) -> dict[str, Any]:
+    """Normalize an SDK record to a plain dict with per-type dispatch.
+
+    The default handler registers pydantic-style models on first sight, so
+    the summary hot loop pays a single type-table lookup per record instead
+    of re-evaluating a hasattr/isinstance cascade.
+    """
+    model_dump = getattr(record, "model_dump", None)
+    if model_dump is not None:
+        _to_dict.register(type(record), _model_to_dict)
+        return model_dump(mode="python", exclude_none=True)
+    return dict(getattr(record, "__dict__", None) or {})
+
+
+def _model_to_dict(record: Any) -> dict[str, Any]:
+    return record.model_dump(mode="python", exclude_none=True)
+
+
+@_to_dict.register(dict)
+def _dict_to_dict(record: dict[str, Any]) -> dict[str, Any]:
+    return record
+
+
+def _extract_categories(raw: Any) -> set[str]:
+    """Collect category names from SDK records in one set-comprehension pass."""
+    if not isinstance(raw, (list, tuple)):
+        return set()
+    return {
+        str(candidate)
+        for candidate in (
+            (item.get("name") or item.get("id"))
+            if isinstance(item, dict)
+            else (getattr(item, "name", None) or getattr(item, "id", None))
+            for item in raw
+        )
+        if candidate
+    }
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_catalog_cached(
+    path_str: str, mtime_ns: int, size: int
+) -> tuple[CatalogEntry, ...]:
+    """Parse ``path_str`` once per (path, mtime, size) generation.
+
+    The catalog file is static per process, so repeat client construction is
+    a dict lookup instead of file I/O plus a regex pass and sort.
+    """
+    return tuple(_parse_catalog(Path(path_str).read_text(encoding="utf-8")))
+
+
+class _ToolRequestBatcher:
+    """Coalesces tool fetches issued within a short window into one SDK call.
+
+    Requests arriving inside ``batch_interval`` (or until ``max_batch_size``)
+    are merged into a single ``tools.get`` on the union of their toolkits and
+    demultiplexed locally, replacing N round-trips with one.
+    """
+
+    def __init__(
+        self,
+        client: ComposioCatalogClient,
+        *,
+        batch_interval: float = 0.01,
+        max_batch_size: int = 10,
+    ) -> None:
+        self._client = client
+        self._batch_interval = batch_interval
+        self._max_batch_size = max_batch_size
+        self._pending: list[tuple[tuple[str, ...], asyncio.Future[list[Any]]]] = []
+        self._flush_task: asyncio.Task[None] | None = None
+
+    def submit(self, toolkits: tuple[str, ...]) -> asyncio.Future[list[Any]]:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[list[Any]] = loop.create_future()
+        self._pending.append((toolkits, future))
+        if len(self._pending) >= self._max_batch_size:
+            if self._flush_task is not None:
+                self._flush_task.cancel()
+                self._flush_task = None
+            loop.create_task(self._flush())
+        elif self._flush_task is None:
+            self._flush_task = loop.create_task(self._delayed_flush())
+        return future
+
+    async def _delayed_flush(self) -> None:
+        await asyncio.sleep(self._batch_interval)
+        await self._flush()
+
+    async def _flush(self) -> None:
+        self._flush_task = None
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        merged = sorted(set().union(*(set(toolkits) for toolkits, _ in pending)))
+        try:
+            tools = await self._client._get_tools_uncached(
+                tuple(merged), limit=50 * len(merged), search=None
+            )
+        except Exception as exc:  # noqa: BLE001 - fan the failure out to waiters
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        by_toolkit: dict[str, list[Any]] = {}
+        for tool in tools:
+            toolkit = (
+                tool.get("toolkit")
+                if isinstance(tool, dict)
+                else getattr(tool, "toolkit", None)
+            )
+            by_toolkit.setdefault(str(toolkit), []).append(tool)
+        for toolkits, future in pending:
+            if not future.done():
+                future.set_result(
+                    [
+                        tool
+                        for toolkit in toolkits
+                        for tool in by_toolkit.get(toolkit, [])
+                    ]
+                )
+
+
+class ComposioCatalogClient:
+    """Read-only view over the distilled Composio tool catalog."""
+
+    def __init__(
+        self, entries: Sequence[CatalogEntry], *, api_key: str | None = None
+    ) -> None:
+        self.entries = list(entries)
+        self._api_key = api_key or os.environ.get("COMPOSIO_API_KEY")
+        self._summary: CatalogSummary | None = None
+        self._tools_cache: OrderedDict[
+            tuple[tuple[str, ...], int, str | None], tuple[float, list[Any]]
+        ] = OrderedDict()
+        self._summary_cache = _summary_cache_path(self._api_key)
+        self._batcher: _ToolRequestBatcher | None = None
+        self._load_cached_summary()
+        # Columnar copies of the catalog: serialization and the checksum walk
+        # four flat string lists instead of allocating a dict per entry.
+        self._titles = [entry.title for entry in self.entries]
+        self._urls = [entry.url for entry in self.entries]
+        self._descs = [entry.description for entry in self.entries]
+        self._cats = [entry.category for entry in self.entries]
+        digest = hashlib.sha256()
+        digest.update(
+            _canonical_dumps([self._titles, self._urls, self._descs, self._cats])
+        )
+        self.checksum = digest.hexdigest()
+
+    def entries_as_records(self) -> list[dict[str, str]]:
+        """Materialize list-of-dicts records only at the serialization boundary."""
+        return [
+            {"title": title, "url": url, "description": description, "category": category}
+            for title, url, description, category in zip(
+                self._titles, self._urls, self._descs, self._cats
+            )
+        ]
+
+    @functools.cached_property
+    def metadata(self) -> dict[str, Any]:
+        """Catalog summary and entry records, materialized on first access."""
+        return {
+            "summary": {
+                "total_entries": len(self.entries),
+                "categories": sorted(set(self._cats)),
+                "toolkits": self._cats.count("toolkits"),
+            },
+            "entries": self.entries_as_records(),
+        }
+
+    @functools.cached_property
+    def _sdk(self) -> Any:
+        """Import and build the async SDK client on first live-catalog access.
+
+        Constructing a catalog client stays near-free for callers (and tests)
+        that only use the static catalog.
+        """
+        try:
+            from composio_client import AsyncComposio
+        except ImportError:
+            logger.debug("composio_client SDK not installed; live catalog disabled")
+            return None
+        return AsyncComposio(
+            api_key=self._api_key, http_client=_get_shared_http_client()
+        )
+
+    def _load_cached_summary(self) -> None:
+        """Serve the on-disk snapshot immediately; revalidate in the background.
+
+        Startup never blocks on the network: a fresh-enough snapshot is used
+        as-is, a stale one is still served while a refresh task replaces it.
+        """
+        try:
+            raw = json.loads(self._summary_cache.read_text(encoding="utf-8"))
+            self._summary = CatalogSummary(
+                toolkits=list(raw["toolkits"]),
+                categories=list(raw["categories"]),
+                fetched_at=float(raw["fetched_at"]),
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+        if time.time() - self._summary.fetched_at > SUMMARY_CACHE_TTL_SECONDS:
+            try:
+                asyncio.get_running_loop().create_task(self._background_refresh())
+            except RuntimeError:
+                pass  # no loop yet; the next refresh() revalidates
+
+    async def _background_refresh(self) -> None:
+        try:
+            await self.refresh()
+        except Exception:  # noqa: BLE001 - stale summary beats a crash
+            logger.warning("catalog background refresh failed; keeping stale summary")
+
+    def _store_summary(self, summary: CatalogSummary) -> None:
+        try:
+            self._summary_cache.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._summary_cache.with_suffix(".json.tmp")
+            tmp_path.write_text(json.dumps(asdict(summary)), encoding="utf-8")
+            os.replace(tmp_path, self._summary_cache)
+        except OSError:
+            pass  # the cache is best-effort
+
+    async def refresh(self) -> CatalogSummary:
+        """Re-pull the live toolkit summary; awaits true async SDK I/O."""
+        try:
+            summary = await self._fetch_summary()
+        except Exception:
+            if self._summary is not None:
+                logger.warning("catalog refresh failed; serving stale summary")
+                return self._summary
+            raise
+        self._summary = summary
+        self._store_summary(summary)
+        self.invalidate()
+        return summary
+
+    async def get_summary(self) -> CatalogSummary:
+        if self._summary is None:
+            await self.refresh()
+        assert self._summary is not None
+        return self._summary
+
+    async def get_tools(
+        self,
+        toolkits: Sequence[str] | None = None,
+        *,
+        limit: int = 50,
+        search: str | None = None,
+    ) -> list[Any]:
+        """Search Composio tools, serving repeats from a TTL-LRU cache.
+
+        Mission discovery re-issues identical queries in bursts; within the
+        TTL those cost a dict probe instead of a network round-trip.
+        """
+        key = (tuple(toolkits or ()), limit, search)
+        now = time.monotonic()
+        cached = self._tools_cache.get(key)
+        if cached is not None and now - cached[0] < TOOLS_CACHE_TTL_SECONDS:
+            self._tools_cache.move_to_end(key)
+            return list(cached[1])
+        tools = await self._get_tools_uncached(key[0], limit=limit, search=search)
+        self._tools_cache[key] = (now, tools)
+        self._tools_cache.move_to_end(key)
+        while len(self._tools_cache) > TOOLS_CACHE_MAX_ENTRIES:
+            self._tools_cache.popitem(last=False)
+        return list(tools)
+
+    async def _get_tools_uncached(
+        self,
+        toolkits: tuple[str, ...],
+        *,
+        limit: int,
+        search: str | None,
+    ) -> list[Any]:
+        if self._sdk is None:
+            return []
+        tools = await self._sdk.tools.get(
+            "mission-discovery",
+            toolkits=list(toolkits),
+            limit=limit,
+            search=search,
+        )
+        return list(tools or [])
+
+    async def get_tools_batched(self, toolkits: Sequence[str]) -> list[Any]:
+        """Fetch tools through the coalescing batcher.
+
+        Callers issuing distinct toolkit queries within the batching window
+        share one SDK round-trip.
+        """
+        if self._batcher is None:
+            self._batcher = _ToolRequestBatcher(self)
+        return await self._batcher.submit(tuple(toolkits or ()))
+
+    def invalidate(self) -> None:
+        """Drop cached tool queries; called when the catalog refreshes."""
+        self._tools_cache.clear()
+
+    async def prefetch(
+        self, toolkits: Sequence[str]
+    ) -> tuple[CatalogSummary, dict[str, list[Any]]]:
+        """Overlap the summary fetch and per-toolkit tool queries.
+
+        Wall time is ~max(RTT) instead of sum(RTT); a failed task degrades to
+        the stale summary or an empty tool list rather than failing the batch.
+        """
+        tasks = [self._fetch_summary()] + [
+            self.get_tools([toolkit]) for toolkit in toolkits
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        summary = results[0]
+        if isinstance(summary, BaseException):
+            logger.warning("catalog summary prefetch failed: %s", summary)
+            summary = self._summary or CatalogSummary(
+                toolkits=[], categories=[], fetched_at=time.time()
+            )
+        else:
+            self._summary = summary
+        tools_by_toolkit: dict[str, list[Any]] = {}
+        for toolkit, result in zip(toolkits, results[1:]):
+            if isinstance(result, BaseException):
+                logger.warning("tool prefetch failed for %s: %s", toolkit, result)
+                tools_by_toolkit[toolkit] = []
+            else:
+                tools_by_toolkit[toolkit] = result
+        return summary, tools_by_toolkit
+
+    async def _fetch_summary(self) -> CatalogSummary:
+        if self._sdk is None:
+            return CatalogSummary(toolkits=[], categories=[], fetched_at=time.time())
+        response = await self._sdk.toolkits.list(limit=50, sort_by="usage")
+        iterable = getattr(response, "items", None) or response or []
+        toolkits: list[dict[str, Any]] = []
+        categories: set[str] = set()
+        for record in iterable:
+            data = _to_dict(record)
+            name = data.get("name") or data.get("slug") or "unknown"
+            meta = data.get("meta") or {}
+            toolkit_categories = _extract_categories(meta.get("categories"))
+            categories |= toolkit_categories
+            raw_auth = meta.get("auth_schemes") or data.get("auth_schemes")
+            auth_schemes = (
+                list(filter(None, map(str, raw_auth)))
+                if isinstance(raw_auth, (list, tuple))
+                else []
+            )
+            toolkits.append(
+                {
+                    "name": str(name),
+                    "description": str(meta.get("description") or ""),
+                    "categories": sorted(toolkit_categories),
+                    "auth_schemes": auth_schemes,
+                }
+            )
+        return CatalogSummary(
+            toolkits=toolkits, categories=sorted(categories), fetched_at=time.time()
+        )
+
+    async def aclose(self) -> None:
+        """Release the SDK client and the shared HTTP pool on shutdown."""
+        global _http_client
+        sdk = self.__dict__.get("_sdk")
+        if sdk is not None:
+            close = getattr(sdk, "close", None)
+            if close is not None:
+                result = close()
+                if asyncio.iscoroutine(result):
+                    await result
+        if _http_client is not None:
+            await _http_client.aclose()
+            _http_client = None
+
+    @classmethod
+    def from_default_cache(cls) -> ComposioCatalogClient:
+        stat = CATALOG_SOURCE.stat()
+        sidecar = CATALOG_SOURCE.with_suffix(".pkl")
+        # Cold starts load the pre-parsed sidecar in one read instead of
+        # re-running the bullet scan; the sidecar invalidates naturally when
+        # the docs file is newer.
+        try:
+            if sidecar.stat().st_mtime_ns >= stat.st_mtime_ns:
+                with sidecar.open("rb") as handle:
+                    rows = pickle.load(handle)
+                return cls([CatalogEntry(*row) for row in rows])
+        except (OSError, pickle.UnpicklingError, EOFError, TypeError):
+            pass
+        entries = _parse_catalog_cached(
+            str(CATALOG_SOURCE), stat.st_mtime_ns, stat.st_size
+        )
+        tmp_path = sidecar.with_suffix(".pkl.tmp")
+        try:
+            with tmp_path.open("wb") as handle:
+                # Field-order tuples pickle without a __dict__ per entry.
+                pickle.dump(
+                    [astuple(entry) for entry in entries],
+                    handle,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(tmp_path, sidecar)
+        except OSError:
+            pass  # the sidecar is best-effort; parsing already succeeded
+        return cls(entries)
+
+
+def _cli_refresh(client: ComposioCatalogClient) -> CatalogSummary:
+    return asyncio.run(client.refresh())
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Inspect the Composio catalog.")
+    parser.add_argument(
+        "--status", action="store_true", help="Print catalog summary and checksum."
+    )
+    parser.add_argument(
+        "--refresh", action="store_true", help="Pull the live toolkit summary."
+    )
+    args = parser.parse_args(argv)
+    client = ComposioCatalogClient.from_default_cache()
+    if args.status:
+        print(
+            json.dumps(
+                {"checksum": client.checksum, **client.metadata["summary"]}, indent=2
+            )
+        )
+    if args.refresh:
+        summary = _cli_refresh(client)
+        print(
+            json.dumps(
+                {
+                    "toolkits": len(summary.toolkits),
+                    "categories": summary.categories,
+                },
+                indent=2,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""Shared loader for agent modules used by the operational scripts.
+
+The scripts deliberately avoid ``import agent`` (it boots the ADK FastAPI
+stack), so the Supabase client module is loaded straight from its file.
+Loading happens once per process: the module is cached in ``sys.modules``,
+and chained scripts share the compiled module instead of re-executing it.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+_MODULE_NAME = "_agent_supabase"
+_SUPABASE_MODULE = (
+    Path(__file__).resolve().parents[1] / "agent" / "services" / "supabase.py"
+)
+
+
+def _load_supabase_module() -> ModuleType:
+    module = sys.modules.get(_MODULE_NAME)
+    if module is not None:
+        return module
+    spec = importlib.util.spec_from_file_location(_MODULE_NAME, _SUPABASE_MODULE)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[_MODULE_NAME] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+_supabase = _load_supabase_module()
+SupabaseClient = _supabase.SupabaseClient
+SupabaseAsyncClient = _supabase.SupabaseAsyncClient
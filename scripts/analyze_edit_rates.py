@@ -0,0 +1,469 @@
+#!/usr/bin/env python3
+"""Analyze planner edit rates for Gate G-B readiness.
+
+Pulls mission metadata and safeguard hints from Supabase, groups field-level
+edits per mission, and writes a JSON report of accept/edit/regenerate rates
+per field and persona.
+
+Usage:
+    python scripts/analyze_edit_rates.py --output docs/readiness/edit_rates.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import urllib.parse
+import urllib.request
+from collections import defaultdict
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass
+from itertools import groupby
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, ClassVar
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional accelerator
+    np = None
+
+try:
+    import urllib3
+    from urllib3.util.retry import Retry
+except ImportError:  # pragma: no cover - optional accelerator
+    urllib3 = None
+    Retry = None
+
+
+@dataclass(slots=True, frozen=True)
+class EditMetrics:
+    field: str
+    total: int
+    accepted: int
+    edited: int
+    regenerated_count: int
+    avg_confidence: float
+
+
+@dataclass(slots=True, frozen=True)
+class PersonaMetrics:
+    persona: str
+    missions: int
+    edit_rate: float
+
+
+class SupabaseClient:
+    """Minimal PostgREST reader used by the readiness scripts."""
+
+    PAGE_SIZE = 1000
+    PAGE_CONCURRENCY = 4
+
+    def __init__(self, url: str | None = None, key: str | None = None) -> None:
+        base = (url or os.environ["SUPABASE_URL"]).rstrip("/")
+        key = key or os.environ["SUPABASE_SERVICE_ROLE_KEY"]
+        self._rest_url = f"{base}/rest/v1"
+        self._headers = {"apikey": key, "Authorization": f"Bearer {key}"}
+        self._http: Any = None
+        # Pooled sync transport with retry/backoff for the non-async paths
+        # (RPC calls and the no-httpx fallback); bare urllib has neither
+        # keepalive nor retries.
+        self._pool: Any = (
+            urllib3.PoolManager(
+                num_pools=2,
+                maxsize=10,
+                retries=Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=(429, 502, 503, 504),
+                ),
+            )
+            if urllib3 is not None
+            else None
+        )
+
+    def _ensure_http(self) -> Any:
+        """Lazily build the keep-alive HTTP/2 client shared by all fetches.
+
+        One pool amortizes the TLS handshake across every page of every
+        table instead of paying it per urlopen call.
+        """
+        if self._http is None:
+            import httpx
+
+            self._http = httpx.AsyncClient(
+                base_url=self._rest_url,
+                headers=self._headers,
+                http2=True,
+                timeout=10.0,
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    def _request(self, path: str, params: dict[str, str]) -> list[dict[str, Any]]:
+        query = urllib.parse.urlencode(params)
+        url = f"{self._rest_url}{path}?{query}"
+        if self._pool is not None:
+            response = self._pool.request(
+                "GET", url, headers=self._headers, timeout=10.0
+            )
+            # PoolManager.request does not raise on HTTP errors; surface
+            # them so callers see a failure, not an error-object body.
+            if response.status >= 400:
+                raise RuntimeError(f"GET {path} returned {response.status}")
+            data = response.data
+            if not data:
+                return []
+            return orjson.loads(data) if orjson is not None else json.loads(data)
+        request = urllib.request.Request(url, headers=self._headers)
+        with urllib.request.urlopen(request, timeout=30) as response:
+            data = response.read()
+        if not data:
+            return []
+        return orjson.loads(data) if orjson is not None else json.loads(data)
+
+    async def fetch_paged(
+        self, path: str, params: dict[str, str], *, limit: int
+    ) -> list[dict[str, Any]]:
+        """Gather PostgREST pages concurrently via ``Range`` headers.
+
+        Pages are requested ``PAGE_CONCURRENCY`` at a time so P pages cost
+        roughly one round-trip per batch instead of P sequential ones. A short
+        or empty page (or 416 past the end of the table) stops the walk.
+        """
+        client = self._ensure_http()
+        page_size = min(self.PAGE_SIZE, limit)
+        rows: list[dict[str, Any]] = []
+        page = 0
+        done = False
+        while not done and len(rows) < limit:
+            batch = range(page, page + self.PAGE_CONCURRENCY)
+            responses = await asyncio.gather(
+                *(
+                    client.get(
+                        path,
+                        params=params,
+                        headers={
+                            "Range-Unit": "items",
+                            "Range": f"{index * page_size}-{(index + 1) * page_size - 1}",
+                        },
+                    )
+                    for index in batch
+                )
+            )
+            for response in responses:
+                if response.status_code == 416:
+                    done = True
+                    break
+                response.raise_for_status()
+                content = response.content
+                page_rows = (
+                    orjson.loads(content) if orjson is not None else json.loads(content)
+                ) if content else []
+                rows.extend(page_rows)
+                if len(page_rows) < page_size:
+                    done = True
+                    break
+            page += self.PAGE_CONCURRENCY
+        return rows[:limit]
+
+    async def fetch_all(
+        self, limit: int = 500
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Fetch both readiness tables over the shared connection pool."""
+        try:
+            return await asyncio.gather(
+                self._fetch_mission_metadata_async(limit),
+                self._fetch_safeguard_hints_async(limit),
+            )
+        finally:
+            await self.aclose()
+
+    def _fetch(
+        self, path: str, params: dict[str, str], limit: int
+    ) -> list[dict[str, Any]]:
+        try:
+            import httpx  # noqa: F401
+        except ImportError:
+            return self._request(path, {**params, "limit": str(limit)})
+
+        async def _run() -> list[dict[str, Any]]:
+            try:
+                return await self.fetch_paged(path, params, limit=limit)
+            finally:
+                await self.aclose()
+
+        return asyncio.run(_run())
+
+    _METADATA_PARAMS: ClassVar[dict[str, str]] = {
+        "select": "mission_id,persona,field,accepted,edited,regenerated,confidence,created_at",
+        "order": "created_at.asc",
+    }
+    _HINT_PARAMS: ClassVar[dict[str, str]] = {"select": "mission_id,hint,accepted,created_at"}
+
+    async def _fetch_mission_metadata_async(self, limit: int) -> list[dict[str, Any]]:
+        return await self.fetch_paged(
+            "/mission_metadata", self._METADATA_PARAMS, limit=limit
+        )
+
+    async def _fetch_safeguard_hints_async(self, limit: int) -> list[dict[str, Any]]:
+        return await self.fetch_paged("/safeguard_hints", self._HINT_PARAMS, limit=limit)
+
+    def fetch_mission_metadata(self, limit: int = 500) -> list[dict[str, Any]]:
+        return self._fetch("/mission_metadata", self._METADATA_PARAMS, limit)
+
+    def fetch_safeguard_hints(self, limit: int = 500) -> list[dict[str, Any]]:
+        return self._fetch("/safeguard_hints", self._HINT_PARAMS, limit)
+
+    def fetch_persona_flags(self, limit: int = 500) -> list[dict[str, Any]]:
+        """Slim projection used alongside the server-side aggregate."""
+        return self._fetch(
+            "/mission_metadata", {"select": "mission_id,persona,edited"}, limit
+        )
+
+    def call_rpc(self, name: str, payload: dict[str, Any] | None = None) -> Any:
+        """POST /rest/v1/rpc/{name} and decode the result."""
+        body = (
+            orjson.dumps(payload or {})
+            if orjson is not None
+            else json.dumps(payload or {}).encode("utf-8")
+        )
+        url = f"{self._rest_url}/rpc/{name}"
+        headers = {**self._headers, "Content-Type": "application/json"}
+        if self._pool is not None:
+            response = self._pool.request(
+                "POST", url, body=body, headers=headers, timeout=10.0
+            )
+            # A missing RPC answers 404 with a JSON error object; raising
+            # here lets main()'s fallback to local analysis engage.
+            if response.status >= 400:
+                raise RuntimeError(f"rpc {name} returned {response.status}")
+            data = response.data
+        else:
+            request = urllib.request.Request(
+                url, data=body, headers=headers, method="POST"
+            )
+            with urllib.request.urlopen(request, timeout=30) as response:
+                data = response.read()
+        if not data:
+            return []
+        return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def analyze(
+    metadata_rows: Sequence[dict[str, Any]],
+) -> tuple[list[EditMetrics], list[PersonaMetrics], float]:
+    """Group rows per mission/field and reduce to per-field and persona stats."""
+    # One C-level sort replaces the two-level defaultdict plus a per-group
+    # re-sort: groupby then walks each (mission, field) run in order.
+    ordered_rows = sorted(
+        metadata_rows, key=itemgetter("mission_id", "field", "created_at")
+    )
+    field_stats: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    for _mission_id, mission_group in groupby(ordered_rows, key=itemgetter("mission_id")):
+        for field, field_group in groupby(mission_group, key=itemgetter("field")):
+            rows = list(field_group)
+            field_stats[field].append(
+                {
+                    "accepted": bool(rows[-1].get("accepted")),
+                    "edited": any(row.get("edited") for row in rows),
+                    "regenerated": sum(1 for row in rows if row.get("regenerated")),
+                    "confidence": float(rows[-1].get("confidence") or 0.0),
+                }
+            )
+
+    edit_metrics: list[EditMetrics] = []
+    for field, stats in sorted(field_stats.items()):
+        total = len(stats)
+        if np is not None and total:
+            # Vectorized reductions: one contiguous array per column instead
+            # of three Python passes over the stats list.
+            accepted = int(
+                np.fromiter(
+                    (stat["accepted"] for stat in stats), dtype=np.bool_, count=total
+                ).sum()
+            )
+            edited = int(
+                np.fromiter(
+                    (stat["edited"] for stat in stats), dtype=np.bool_, count=total
+                ).sum()
+            )
+            regenerated = int(
+                np.fromiter(
+                    (stat["regenerated"] for stat in stats), dtype=np.int64, count=total
+                ).sum()
+            )
+            avg_confidence = float(
+                np.fromiter(
+                    (stat["confidence"] for stat in stats), dtype=np.float64, count=total
+                ).mean()
+            )
+        else:
+            accepted = sum(1 for stat in stats if stat["accepted"])
+            edited = sum(1 for stat in stats if stat["edited"])
+            regenerated = sum(stat["regenerated"] for stat in stats)
+            avg_confidence = (
+                sum(stat["confidence"] for stat in stats) / total if total else 0.0
+            )
+        edit_metrics.append(
+            EditMetrics(field, total, accepted, edited, regenerated, avg_confidence)
+        )
+
+    return (
+        edit_metrics,
+        persona_metrics_from_rows(metadata_rows),
+        median_regenerations(edit_metrics),
+    )
+
+
+def persona_metrics_from_rows(
+    metadata_rows: Sequence[dict[str, Any]],
+) -> list[PersonaMetrics]:
+    persona_missions: dict[str, set[str]] = defaultdict(set)
+    persona_edited: dict[str, set[str]] = defaultdict(set)
+    for row in metadata_rows:
+        persona = row.get("persona") or "unknown"
+        persona_missions[persona].add(row["mission_id"])
+        if row.get("edited"):
+            persona_edited[persona].add(row["mission_id"])
+    return [
+        PersonaMetrics(
+            persona, len(missions), len(persona_edited[persona]) / len(missions)
+        )
+        for persona, missions in sorted(persona_missions.items())
+    ]
+
+
+def median_regenerations(edit_metrics: Sequence[EditMetrics]) -> float:
+    # A sum/len here silently reported the mean; Gate G-B thresholds are
+    # defined over the median regeneration count.
+    if not edit_metrics:
+        return 0.0
+    if np is not None:
+        return float(
+            np.median(
+                np.fromiter(
+                    (metrics.regenerated_count for metrics in edit_metrics),
+                    dtype=np.int64,
+                    count=len(edit_metrics),
+                )
+            )
+        )
+    return float(
+        statistics.median(metrics.regenerated_count for metrics in edit_metrics)
+    )
+
+
+def edit_metrics_from_rpc(rows: Sequence[dict[str, Any]]) -> list[EditMetrics]:
+    """Adapt ``analyze_edit_rates_agg`` rows into EditMetrics records."""
+    return [
+        EditMetrics(
+            row["field"],
+            int(row["total"]),
+            int(row["accepted"]),
+            int(row["edited"]),
+            int(row["regenerated"]),
+            float(row["avg_conf"] or 0.0),
+        )
+        for row in rows
+    ]
+
+
+def build_report(
+    edit_metrics: Sequence[EditMetrics],
+    persona_metrics: Sequence[PersonaMetrics],
+    median_regenerations: float,
+    hint_rows: Sequence[dict[str, Any]],
+) -> dict[str, Any]:
+    hint_total = len(hint_rows)
+    hint_accepted = sum(1 for row in hint_rows if row.get("accepted"))
+    return {
+        "gate": "G-B",
+        "field_metrics": [asdict(metrics) for metrics in edit_metrics],
+        "personas": [asdict(metrics) for metrics in persona_metrics],
+        "median_regenerations": median_regenerations,
+        "safeguard_hints": {
+            "total": hint_total,
+            "accepted": hint_accepted,
+            "accept_rate": hint_accepted / hint_total if hint_total else 0.0,
+        },
+    }
+
+
+def write_report(report: dict[str, Any], output: Path) -> None:
+    """Stream the report to disk without materializing the full JSON string.
+
+    ``field_metrics`` dominates the payload as catalogs grow, so each entry
+    is encoded and written individually; only the small summary head is
+    serialized in one piece.
+    """
+    if orjson is not None:
+        dumps = lambda obj: orjson.dumps(obj).decode("utf-8")
+    else:
+        dumps = json.dumps
+    head = {key: value for key, value in report.items() if key != "field_metrics"}
+    with output.open("w", encoding="utf-8") as handle:
+        handle.write(dumps(head)[:-1])
+        handle.write(',"field_metrics":[')
+        for index, metrics in enumerate(report["field_metrics"]):
+            if index:
+                handle.write(",")
+            handle.write(dumps(metrics))
+        handle.write("]}")
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--output",
+        default="docs/readiness/edit_rates.json",
+        help="Path for the JSON report.",
+    )
+    parser.add_argument("--limit", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    client = SupabaseClient()
+    # Prefer the server-side aggregate: ship per-field aggregates plus a slim
+    # persona projection instead of every raw telemetry row.
+    try:
+        agg_rows = client.call_rpc("analyze_edit_rates_agg")
+    except Exception:  # noqa: BLE001 - any RPC failure falls back to local analysis
+        agg_rows = None
+    if agg_rows:
+        edit_metrics = edit_metrics_from_rpc(agg_rows)
+        persona_metrics = persona_metrics_from_rows(
+            client.fetch_persona_flags(limit=args.limit)
+        )
+        median = median_regenerations(edit_metrics)
+        hint_rows = client.fetch_safeguard_hints(limit=args.limit)
+    else:
+        try:
+            import httpx  # noqa: F401
+        except ImportError:
+            metadata_rows = client.fetch_mission_metadata(limit=args.limit)
+            hint_rows = client.fetch_safeguard_hints(limit=args.limit)
+        else:
+            metadata_rows, hint_rows = asyncio.run(client.fetch_all(args.limit))
+        edit_metrics, persona_metrics, median = analyze(metadata_rows)
+    report = build_report(edit_metrics, persona_metrics, median, hint_rows)
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    write_report(report, output)
+    print(f"wrote {output} ({len(edit_metrics)} fields)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""Check copilot message retention and optionally run cleanup.
+
+Reports how many live ``copilot_messages`` rows have outlived the retention
+window and, with ``--cleanup``, invokes the ``cleanup_copilot_messages`` RPC.
+
+Usage:
+    python scripts/check_retention.py --ttl-days 30 [--cleanup] [--strict]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+from collections.abc import Sequence
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+_SCRIPTS_DIR = str(Path(__file__).resolve().parent)
+if _SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPTS_DIR)
+from _bootstrap import SupabaseAsyncClient, SupabaseClient
+
+DEFAULT_TTL_DAYS = 30
+STALE_FETCH_LIMIT = 50
+
+
+def _build_params(cutoff: datetime, tenant_id: str | None) -> dict[str, str]:
+    params = {
+        "select": "id,session_key,created_at",
+        "created_at": f"lt.{cutoff.isoformat()}",
+        "soft_deleted_at": "is.null",
+        "order": "created_at.asc",
+        "limit": str(STALE_FETCH_LIMIT),
+    }
+    if tenant_id:
+        params["tenant_id"] = f"eq.{tenant_id}"
+    return params
+
+
+def _count_params(cutoff: datetime, tenant_id: str | None) -> dict[str, str]:
+    params = {
+        "created_at": f"lt.{cutoff.isoformat()}",
+        "soft_deleted_at": "is.null",
+    }
+    if tenant_id:
+        params["tenant_id"] = f"eq.{tenant_id}"
+    return params
+
+
+def _count_stale(client: Any, cutoff: datetime, tenant_id: str | None = None) -> int:
+    """Zero-body count probe; non-verbose runs never ship row payloads."""
+    return client.count("/copilot_messages", _count_params(cutoff, tenant_id))
+
+
+async def _count_stale_by_tenant(
+    cutoff: datetime, tenants: Sequence[str]
+) -> dict[str, int]:
+    client = SupabaseAsyncClient.from_env()
+    try:
+        counts = await asyncio.gather(
+            *(
+                client.count("/copilot_messages", _count_params(cutoff, tenant))
+                for tenant in tenants
+            )
+        )
+    finally:
+        await client.aclose()
+    return dict(zip(tenants, counts))
+
+
+def _fetch_stale_rows(
+    client: Any, cutoff: datetime, tenant_id: str | None = None
+) -> list[dict[str, Any]]:
+    return client._request(
+        "GET", "/copilot_messages", params=_build_params(cutoff, tenant_id)
+    ) or []
+
+
+async def _fetch_stale_by_tenant(
+    cutoff: datetime, tenants: Sequence[str]
+) -> dict[str, list[dict[str, Any]]]:
+    """Overlap the per-tenant stale queries instead of paying serial RTTs."""
+    client = SupabaseAsyncClient.from_env()
+    try:
+        results = await asyncio.gather(
+            *(
+                client._request(
+                    "GET", "/copilot_messages", params=_build_params(cutoff, tenant)
+                )
+                for tenant in tenants
+            )
+        )
+    finally:
+        await client.aclose()
+    return {tenant: rows or [] for tenant, rows in zip(tenants, results)}
+
+
+CLEANUP_BATCH_SIZE = 5000
+
+
+def _run_cleanup(client: Any, ttl_days: int) -> int:
+    """Drain the backlog one bounded RPC at a time.
+
+    Each call deletes at most one batch inside a short transaction, so a
+    large backlog never holds table locks for its full duration.
+    """
+    total = 0
+    while True:
+        deleted = int(
+            client._request(
+                "POST",
+                "/rpc/cleanup_copilot_messages",
+                body={
+                    "retention_days": ttl_days,
+                    "batch_size": CLEANUP_BATCH_SIZE,
+                    "max_batches": 1,
+                },
+            )
+            or 0
+        )
+        total += deleted
+        if deleted < CLEANUP_BATCH_SIZE:
+            return total
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ttl-days", type=int, default=DEFAULT_TTL_DAYS)
+    parser.add_argument(
+        "--tenant-id",
+        action="append",
+        default=None,
+        help="Repeatable; multiple tenants are audited concurrently.",
+    )
+    parser.add_argument(
+        "--cleanup", action="store_true", help="Delete rows past the retention window."
+    )
+    parser.add_argument(
+        "--strict", action="store_true", help="Exit 1 when stale rows remain."
+    )
+    parser.add_argument(
+        "--verbose", action="store_true", help="Dump the stale rows as JSON."
+    )
+    args = parser.parse_args(argv)
+
+    cutoff = datetime.now(timezone.utc) - timedelta(days=args.ttl_days)
+    client = SupabaseClient.from_env()
+    tenants = args.tenant_id or []
+    if args.verbose:
+        if len(tenants) > 1:
+            stale_by_tenant = asyncio.run(_fetch_stale_by_tenant(cutoff, tenants))
+            for tenant, rows in stale_by_tenant.items():
+                print(f"  {tenant}: {len(rows)} stale rows")
+            stale_rows = [row for rows in stale_by_tenant.values() for row in rows]
+        else:
+            stale_rows = _fetch_stale_rows(
+                client, cutoff, tenants[0] if tenants else None
+            )
+        stale_total = len(stale_rows)
+        if stale_rows:
+            print(json.dumps(stale_rows, indent=2, default=str))
+    elif len(tenants) > 1:
+        counts = asyncio.run(_count_stale_by_tenant(cutoff, tenants))
+        for tenant, total in counts.items():
+            print(f"  {tenant}: {total} stale rows")
+        stale_total = sum(counts.values())
+    else:
+        stale_total = _count_stale(client, cutoff, tenants[0] if tenants else None)
+    print(f"{stale_total} stale copilot_messages rows older than {args.ttl_days}d")
+    if args.cleanup:
+        deleted = _run_cleanup(client, args.ttl_days)
+        print(f"cleanup removed {deleted} rows")
+        return 0
+    if args.strict and stale_total:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,609 @@
+#!/usr/bin/env python3
+"""Seed the mission library with the curated play catalog.
+
+Generates a deterministic placeholder embedding for each play and inserts
+the rows into ``library_entries`` via PostgREST. Until a real embedding
+pipeline lands, the vectors only need to be stable across reruns so that
+planner ranking stays reproducible.
+
+Usage:
+    python scripts/seed_library.py --tenant-id <tenant> [--dry-run]
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import gzip
+import hashlib
+import json
+import os
+import random
+import sys
+import urllib.request
+import uuid
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import islice
+from typing import Any, NamedTuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+try:
+    import numpy as np
+    from numpy.random import PCG64, Generator
+except ImportError:  # pragma: no cover - optional accelerator
+    np = Generator = PCG64 = None
+
+EMBEDDING_DIMENSIONS = 1536
+
+
+class LibraryPlay(NamedTuple):
+    """One curated play: what it does, who it serves, how to undo it.
+
+    NamedTuple over a slotted dataclass: construction is a C-level tuple
+    build with zero __init__ bytecode, and the records are immutable,
+    built once, and only ever read.
+    """
+
+    title: str
+    description: str
+    persona: str
+    confidence_score: float
+    impact: str
+    risk: str
+    undo_plan: str
+    embedding: Sequence[float]
+    metadata: dict[str, Any]
+
+
+def _seed(text: str) -> int:
+    # Seed derivation only needs determinism, not cryptographic strength;
+    # blake2b emits the 8 needed bytes directly and is faster on short text.
+    return int.from_bytes(
+        hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "big"
+    )
+
+
+@functools.cache
+def _fake_embedding(
+    text: str, dimensions: int = EMBEDDING_DIMENSIONS
+) -> Sequence[float]:
+    """Deterministic placeholder embedding derived from the play text.
+
+    Memoized per text: the function is pure, so dry-run plus real-run (or
+    retries in one process) reuse the cached vector. Cache entries are kept
+    immutable (read-only ndarray, or a tuple on the fallback path).
+    """
+    seed = _seed(text)
+    if Generator is not None:
+        # One vectorized draw instead of `dimensions` Python-level
+        # rng.uniform() calls; fp32 halves both heap and wire size, and
+        # pgvector stores 4-byte floats anyway.
+        vector = Generator(PCG64(seed)).uniform(-1.0, 1.0, dimensions)
+        vector = vector.astype(np.float32)
+        vector.setflags(write=False)
+        return vector
+    rng = random.Random(seed)
+    return tuple(rng.uniform(-1.0, 1.0) for _ in range(dimensions))
+
+
+# Catalog as data, not code: one compact row per play in the order
+# (title, description, persona, confidence_score, impact, risk,
+# undo_plan, toolkit_hints). Parsed once at import time.
+_PLAY_ROWS: tuple = (
+    (
+        "Triage overnight support queue",
+        "Group unread overnight tickets by product area and severity.",
+        "ops",
+        0.82,
+        "high",
+        "low",
+        "Restore original ticket tags from the change log.",
+        ("zendesk", "slack"),
+    ),
+    (
+        "Reconcile calendar conflicts",
+        "Find double-booked meetings this week and propose new slots.",
+        "ops",
+        0.74,
+        "medium",
+        "low",
+        "Decline the proposed slots; originals stay untouched.",
+        ("googlecalendar",),
+    ),
+    (
+        "Summarize vendor status reports",
+        "Condense this week's vendor emails into one status digest.",
+        "ops",
+        0.78,
+        "medium",
+        "low",
+        "Delete the digest draft; source emails are read-only.",
+        ("gmail", "notion"),
+    ),
+    (
+        "Audit stale access grants",
+        "List workspace members inactive for 90 days with their roles.",
+        "ops",
+        0.69,
+        "high",
+        "medium",
+        "Report only; no grants are revoked without approval.",
+        ("googleworkspace",),
+    ),
+    (
+        "Prepare weekly ops digest",
+        "Compile incidents, deploys, and open risks into Monday's digest.",
+        "ops",
+        0.85,
+        "medium",
+        "low",
+        "Unpublish the digest page.",
+        ("notion", "slack"),
+    ),
+    (
+        "Draft follow-up after discovery call",
+        "Write a recap email with agreed next steps within an hour of the call.",
+        "sales",
+        0.88,
+        "high",
+        "low",
+        "Discard the draft before it is sent.",
+        ("gmail", "hubspot"),
+    ),
+    (
+        "Re-engage dormant pipeline deals",
+        "Draft personalized nudges for deals idle more than 21 days.",
+        "sales",
+        0.72,
+        "high",
+        "medium",
+        "Delete unsent drafts and clear the follow-up tasks.",
+        ("hubspot", "gmail"),
+    ),
+    (
+        "Research inbound lead company",
+        "Build a one-page brief on the lead's company, stack, and news.",
+        "sales",
+        0.79,
+        "medium",
+        "low",
+        "Delete the brief; no external contact is made.",
+        ("serpapi", "notion"),
+    ),
+    (
+        "Prepare renewal talking points",
+        "Summarize usage trends and open tickets ahead of a renewal call.",
+        "sales",
+        0.76,
+        "medium",
+        "low",
+        "Delete the talking-points document.",
+        ("hubspot", "zendesk"),
+    ),
+    (
+        "Log meeting notes to CRM",
+        "Attach structured call notes to the matching CRM deal record.",
+        "sales",
+        0.83,
+        "medium",
+        "low",
+        "Remove the note from the deal timeline.",
+        ("hubspot",),
+    ),
+    (
+        "Draft replies for common billing questions",
+        "Answer invoice and receipt questions from the approved macros.",
+        "support",
+        0.81,
+        "medium",
+        "low",
+        "Discard the drafts; nothing is sent automatically.",
+        ("zendesk", "stripe"),
+    ),
+    (
+        "Escalate aging high-severity tickets",
+        "Flag sev-1 and sev-2 tickets breaching SLA to the on-call channel.",
+        "support",
+        0.86,
+        "high",
+        "low",
+        "Delete the escalation messages; ticket state is unchanged.",
+        ("zendesk", "slack"),
+    ),
+    (
+        "Publish weekly known-issues digest",
+        "Summarize active incidents and workarounds for the help center.",
+        "support",
+        0.71,
+        "medium",
+        "medium",
+        "Unpublish the help-center article.",
+        ("zendesk", "notion"),
+    ),
+    (
+        "Tag and route untriaged tickets",
+        "Apply product-area tags and assign untriaged tickets to queues.",
+        "support",
+        0.77,
+        "medium",
+        "low",
+        "Revert tags and assignments from the audit trail.",
+        ("zendesk",),
+    ),
+    (
+        "Follow up on pending customer confirmations",
+        "Remind customers whose tickets await their reply for 72 hours.",
+        "support",
+        0.75,
+        "medium",
+        "low",
+        "Cancel the queued reminder messages.",
+        ("zendesk", "gmail"),
+    ),
+    (
+        "Chase overdue invoices",
+        "Draft polite dunning emails for invoices 15+ days past due.",
+        "finance",
+        0.8,
+        "high",
+        "medium",
+        "Delete unsent drafts; no reminders leave without approval.",
+        ("stripe", "gmail"),
+    ),
+    (
+        "Flag anomalous expense reports",
+        "Surface expense lines that deviate from category norms.",
+        "finance",
+        0.68,
+        "medium",
+        "low",
+        "Clear the review flags; reports stay unmodified.",
+        ("sheets",),
+    ),
+    (
+        "Prepare monthly spend summary",
+        "Roll vendor and card spend into the month-end summary sheet.",
+        "finance",
+        0.84,
+        "medium",
+        "low",
+        "Restore the prior version of the summary sheet.",
+        ("sheets", "stripe"),
+    ),
+    (
+        "Reconcile payouts against ledger",
+        "Match processor payouts to ledger entries and list mismatches.",
+        "finance",
+        0.7,
+        "high",
+        "medium",
+        "Report only; ledger entries are never edited.",
+        ("stripe", "sheets"),
+    ),
+    (
+        "Draft budget variance notes",
+        "Explain the largest budget-to-actual deltas for the review deck.",
+        "finance",
+        0.73,
+        "medium",
+        "low",
+        "Delete the variance notes document.",
+        ("sheets", "notion"),
+    ),
+    (
+        "Repurpose webinar into blog outline",
+        "Turn the latest webinar transcript into a structured blog outline.",
+        "marketing",
+        0.74,
+        "medium",
+        "low",
+        "Delete the outline draft.",
+        ("notion",),
+    ),
+    (
+        "Compile campaign performance snapshot",
+        "Pull spend, clicks, and conversions into the weekly snapshot.",
+        "marketing",
+        0.79,
+        "medium",
+        "low",
+        "Restore the prior snapshot version.",
+        ("googleads", "sheets"),
+    ),
+    (
+        "Draft newsletter from product updates",
+        "Assemble shipped changes into the monthly customer newsletter.",
+        "marketing",
+        0.77,
+        "medium",
+        "low",
+        "Discard the newsletter draft before scheduling.",
+        ("mailchimp", "notion"),
+    ),
+    (
+        "Refresh stale landing-page copy",
+        "Propose copy updates for pages unchanged in six months.",
+        "marketing",
+        0.66,
+        "low",
+        "medium",
+        "Revert the page to its previous published revision.",
+        ("webflow",),
+    ),
+    (
+        "Curate social mentions digest",
+        "Collect notable brand mentions into a daily digest message.",
+        "marketing",
+        0.7,
+        "low",
+        "low",
+        "Delete the digest message.",
+        ("twitter", "slack"),
+    ),
+)
+
+
+# Forking a worker pool costs ~100ms; only worth it past a few hundred
+# embeddings. Today's 25-play catalog always takes the serial path.
+_PARALLEL_THRESHOLD = 256
+
+
+def _bulk_embeddings(texts: Sequence[str]) -> list[Sequence[float]]:
+    """Embed many texts, packing the vectors into one contiguous buffer.
+
+    With numpy, the whole working set is a single (N, dims) fp32
+    allocation and each play holds a row view into it — one malloc,
+    contiguous for any downstream vector math. Without numpy, large
+    catalogs spread the pure-Python RNG across a process pool.
+    """
+    if np is not None:
+        matrix = np.empty((len(texts), EMBEDDING_DIMENSIONS), dtype=np.float32)
+        for index, text in enumerate(texts):
+            matrix[index] = Generator(PCG64(_seed(text))).uniform(
+                -1.0, 1.0, EMBEDDING_DIMENSIONS
+            )
+        matrix.setflags(write=False)
+        return list(matrix)
+    if len(texts) >= _PARALLEL_THRESHOLD:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return list(executor.map(_fake_embedding, texts, chunksize=32))
+    return [_fake_embedding(text) for text in texts]
+
+
+def generate_plays() -> list[LibraryPlay]:
+    """Return the curated 25-play catalog, five plays per persona."""
+    embeddings = _bulk_embeddings([row[0] for row in _PLAY_ROWS])
+    return [
+        LibraryPlay(
+            *row[:7],
+            embedding=embedding,
+            # Fully merged at definition time so the entry build shares a
+            # reference instead of copying a dict per play.
+            metadata={
+                "impact": row[4],
+                "risk": row[5],
+                "undo_plan": row[6],
+                "toolkit_hints": list(row[7]),
+            },
+        )
+        for row, embedding in zip(_PLAY_ROWS, embeddings)
+    ]
+
+
+def _jsonable(value: Any) -> Any:
+    """stdlib-json fallback for ndarray embeddings."""
+    if np is not None and isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"not JSON serializable: {type(value).__name__}")
+
+
+BULK_SIZE = 500
+
+
+def _batched(
+    iterable: Iterable[dict[str, Any]], size: int
+) -> Iterator[list[dict[str, Any]]]:
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+class SupabaseClient:
+    """Minimal PostgREST client for the seeding path."""
+
+    def __init__(self, url: str, service_key: str) -> None:
+        self.url = url.rstrip("/")
+        self.service_key = service_key
+        self._headers = {
+            "apikey": service_key,
+            "Authorization": f"Bearer {service_key}",
+            "Content-Type": "application/json",
+            # Bodies are ~50-60% gzip-compressible ASCII floats; level 1
+            # costs a few ms and roughly halves upload bytes.
+            "Content-Encoding": "gzip",
+            # Upsert on rerun: seed ids are deterministic per tenant.
+            "Prefer": "resolution=merge-duplicates,return=minimal",
+        }
+        self._http: Any = None
+
+    def _ensure_http(self) -> Any:
+        """Lazily build one keep-alive client shared by every batch."""
+        if self._http is None:
+            try:
+                import httpx
+            except ImportError:  # pragma: no cover - optional accelerator
+                return None
+            self._http = httpx.Client(
+                headers=self._headers,
+                timeout=30.0,
+                transport=httpx.HTTPTransport(retries=3),
+            )
+        return self._http
+
+    @classmethod
+    def from_env(cls) -> SupabaseClient:
+        url = os.environ.get("SUPABASE_URL")
+        key = os.environ.get("SUPABASE_SERVICE_ROLE_KEY")
+        if not url or not key:
+            raise RuntimeError(
+                "SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY must be set"
+            )
+        return cls(url, key)
+
+    @staticmethod
+    def _encode(batch: list[dict[str, Any]]) -> bytes:
+        # Batches are dominated by embedding floats; orjson formats them in
+        # C (and accepts ndarrays directly) instead of per-float repr().
+        if orjson is not None:
+            return orjson.dumps(batch, option=orjson.OPT_SERIALIZE_NUMPY)
+        return json.dumps(batch, default=_jsonable).encode("utf-8")
+
+    def insert_library_entries(
+        self, entries: Iterable[dict[str, Any]], batch_size: int = BULK_SIZE
+    ) -> int:
+        """POST the entries in batches over one connection; returns the count.
+
+        Accepts any iterable and buffers at most one batch of dicts at a
+        time, so peak memory stays bounded by batch_size regardless of
+        catalog size. Batching also keeps each request inside PostgREST's
+        payload budget while the keep-alive client amortizes the TLS
+        handshake across batches.
+        """
+        url = f"{self.url}/rest/v1/library_entries"
+        http = self._ensure_http()
+        inserted = 0
+        for batch in _batched(entries, batch_size):
+            data = gzip.compress(self._encode(batch), compresslevel=1)
+            if http is not None:
+                http.post(url, content=data).raise_for_status()
+            else:
+                request = urllib.request.Request(
+                    url=url, data=data, headers=self._headers, method="POST"
+                )
+                with urllib.request.urlopen(request, timeout=30):
+                    pass
+            inserted += len(batch)
+        return inserted
+
+
+@functools.lru_cache(maxsize=1)
+def _template_entries() -> tuple:
+    """Tenant-independent entry templates, built once per process.
+
+    Everything but id and tenant_id is static, so repeated seed_library
+    calls (dry-run then real run, CLI retries) only stamp those two keys.
+    Built lazily rather than at import so merely importing the module
+    stays cheap.
+    """
+    return tuple(
+        {
+            "title": play.title,
+            "description": play.description,
+            "persona": play.persona,
+            "confidence_score": play.confidence_score,
+            "embedding": play.embedding,
+            "metadata": play.metadata,
+        }
+        for play in generate_plays()
+    )
+
+
+def _build_entries(tenant_id: str) -> Iterator[dict[str, Any]]:
+    """Yield row dicts one at a time for the streaming insert path."""
+    # Hash the tenant into a namespace once; per-play uuid5 calls then only
+    # hash the short title instead of the tenant-prefixed concatenation.
+    tenant_ns = uuid.uuid5(uuid.NAMESPACE_DNS, tenant_id)
+    for template in _template_entries():
+        yield {
+            **template,
+            "id": str(uuid.uuid5(tenant_ns, template["title"])),
+            "tenant_id": tenant_id,
+        }
+
+
+def _copy_entries(dsn: str, entries: Iterable[dict[str, Any]]) -> int:
+    """Bulk-load entries with COPY ... FROM STDIN over a direct connection.
+
+    Bypasses per-batch HTTP+JSON entirely, which is where large seeds
+    spend their time; note COPY appends rather than upserts, so this path
+    is for first-time seeds. Text format keeps the pgvector column simple
+    (binary framing would pull in the pgvector adapter package).
+    """
+    import psycopg
+
+    columns = (
+        "id",
+        "tenant_id",
+        "title",
+        "description",
+        "persona",
+        "confidence_score",
+        "embedding",
+        "metadata",
+    )
+    count = 0
+    with psycopg.connect(dsn) as conn, conn.cursor() as cursor:
+        statement = f"copy library_entries ({', '.join(columns)}) from stdin"
+        with cursor.copy(statement) as copy:
+            for entry in entries:
+                vector = "[" + ",".join(map(str, entry["embedding"])) + "]"
+                copy.write_row(
+                    (
+                        entry["id"],
+                        entry["tenant_id"],
+                        entry["title"],
+                        entry["description"],
+                        entry["persona"],
+                        entry["confidence_score"],
+                        vector,
+                        json.dumps(entry["metadata"]),
+                    )
+                )
+                count += 1
+    return count
+
+
+def seed_library(client: Any, tenant_id: str, dry_run: bool = False) -> int:
+    """Insert the play catalog for one tenant; returns the entry count.
+
+    Entries stream from a generator into batched inserts, so only one
+    batch of fully built dicts is alive at a time. Setting PG_DSN routes
+    the load through COPY instead of PostgREST.
+    """
+    entries = _build_entries(tenant_id)
+    if dry_run:
+        count = sum(1 for _ in entries)
+        print(f"dry-run: would insert {count} library entries")
+        return count
+    dsn = os.environ.get("PG_DSN")
+    if dsn:
+        count = _copy_entries(dsn, entries)
+    else:
+        count = client.insert_library_entries(entries)
+    print(f"inserted {count} library entries for tenant {tenant_id}")
+    return count
+
+
+def main(argv: Any = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tenant-id", required=True)
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Build entries without inserting."
+    )
+    args = parser.parse_args(argv)
+
+    client = None
+    if not args.dry_run and not os.environ.get("PG_DSN"):
+        client = SupabaseClient.from_env()
+    seed_library(client, args.tenant_id, dry_run=args.dry_run)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Persistence QA for CopilotKit transcript rows.
+
+Writes a short user/assistant exchange into ``copilot_messages`` and
+prints the resulting snapshot. Without Supabase credentials the writes
+land in an offline buffer so the payload shapes can still be inspected.
+
+Usage:
+    python scripts/test_copilotkit_persistence.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from collections.abc import Sequence
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+_SCRIPTS_DIR = str(Path(__file__).resolve().parent)
+if _SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPTS_DIR)
+from _bootstrap import SupabaseAsyncClient
+
+SESSION_KEY = "qa/copilotkit"
+
+# Offline fallback: without credentials, writes accumulate here and the
+# snapshot is printed instead of hitting PostgREST.
+_offline_buffer: list[dict[str, Any]] = []
+
+
+def _qa_messages() -> list[dict[str, Any]]:
+    now = datetime.now(timezone.utc).isoformat()
+    return [
+        {
+            "session_key": SESSION_KEY,
+            "role": "user",
+            "content": {"text": "Draft the weekly ops digest.", "sent_at": now},
+        },
+        {
+            "session_key": SESSION_KEY,
+            "role": "assistant",
+            "content": {"text": "Digest draft ready for review.", "sent_at": now},
+        },
+    ]
+
+
+async def _gather_writes(messages: list[dict[str, Any]]) -> None:
+    """Overlap the independent QA writes instead of paying serial RTTs."""
+    client = SupabaseAsyncClient.from_env()
+    try:
+        await asyncio.gather(
+            *(
+                client._request("POST", "/copilot_messages", body=message)
+                for message in messages
+            )
+        )
+    finally:
+        await client.aclose()
+
+
+def run_transcript_checks(online: Any) -> None:
+    """Write one QA exchange down the transcript persistence path."""
+    messages = _qa_messages()
+    if not online:
+        for message in messages:
+            _offline_buffer.append({"table": "copilot_messages", "payload": message})
+        return
+    asyncio.run(_gather_writes(messages))
+
+
+def build_snapshot() -> dict[str, Any]:
+    return {
+        "session_key": SESSION_KEY,
+        "offline": bool(_offline_buffer),
+        "message_count": len(_offline_buffer) or 2,
+        "messages": [entry["payload"] for entry in _offline_buffer],
+    }
+
+
+def _dump(snapshot: dict[str, Any]) -> str:
+    # orjson formats the nested payload in C; stdlib stays the fallback.
+    if orjson is not None:
+        return orjson.dumps(
+            snapshot, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS, default=str
+        ).decode()
+    return json.dumps(snapshot, indent=2, sort_keys=True, default=str)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.parse_args(argv)
+
+    online = bool(
+        os.environ.get("SUPABASE_URL") and os.environ.get("SUPABASE_SERVICE_ROLE_KEY")
+    )
+    run_transcript_checks(online)
+    print(_dump(build_snapshot()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
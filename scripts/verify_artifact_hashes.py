@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""Verify the SHA-256 hashes recorded in an evidence bundle.
+
+Each artifact in a bundle carries the hash of its ``content`` payload,
+computed over canonical JSON (sorted keys, compact separators). This
+recomputes every hash and reports mismatches, so tampered or corrupted
+evidence is caught before a bundle is accepted.
+
+Usage:
+    python scripts/verify_artifact_hashes.py --bundle artifacts/evidence.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import hashlib
+import hmac
+import json
+import mmap
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+# ensure_ascii=False keeps the stdlib canonical bytes identical to
+# orjson's UTF-8 output, so hashes agree regardless of encoder.
+_ENCODER = json.JSONEncoder(
+    sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+)
+
+# Coalesce encoder chunks before hashing: tiny update() calls cross the
+# Python/C boundary per token, which starves the hardware SHA pipeline
+# (OpenSSL's SHA-NI path wants well over 16 KB per update to stay fed).
+# 64 KB matches the buffer size hashlib.file_digest uses internally.
+_CHUNK_TARGET = 64 * 1024
+
+# Worker-pool startup plus pickling every payload costs far more than
+# hashing a typical bundle, and workers see neither the id() dedupe nor
+# the leaf LRU cache, so only very large bundles leave the serial path.
+_PARALLEL_THRESHOLD = 500
+
+# Built once at import: tests and batch callers invoke main() repeatedly
+# and should not pay parser construction per call.
+_PARSER = argparse.ArgumentParser(description=__doc__)
+_PARSER.add_argument("--bundle", type=Path, required=True)
+
+
+def _hash_payload_direct(payload: Any) -> str:
+    """Canonical SHA-256 of one artifact payload, always recomputed.
+
+    The encoder streams straight into the hasher through a fixed
+    coalescing buffer, so peak memory stays bounded by the buffer size
+    instead of the full canonical rendering of the payload.
+    """
+    if orjson is not None and isinstance(payload, (dict, list)):
+        # Sorted-key canonical bytes in one C call, no str round-trip.
+        canonical = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS, default=str)
+        return hashlib.sha256(canonical).hexdigest()
+    digest = hashlib.sha256()
+    buffer = bytearray()
+    for chunk in _ENCODER.iterencode(payload):
+        buffer += chunk.encode("utf-8")
+        if len(buffer) >= _CHUNK_TARGET:
+            digest.update(buffer)
+            buffer.clear()
+    if buffer:
+        digest.update(buffer)
+    return digest.hexdigest()
+
+
+def _canonical_length(payload: Any) -> int:
+    """Byte length of the canonical encoding, without hashing it."""
+    if orjson is not None and isinstance(payload, (dict, list)):
+        return len(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS, default=str))
+    return sum(len(chunk.encode("utf-8")) for chunk in _ENCODER.iterencode(payload))
+
+
+@functools.lru_cache(maxsize=4096)
+def _hash_leaf(kind: str, payload: Any) -> str:
+    # Keyed by (type, value): bool and int compare equal in Python but
+    # canonicalize differently, so the type name keeps them apart.
+    return _hash_payload_direct(payload)
+
+
+def _hash_payload(payload: Any) -> str:
+    """Canonical SHA-256 of one artifact payload, memoized for leaves.
+
+    Scalar payloads (shared log lines, repeated snippets) hit an LRU
+    cache; containers are recomputed since their value identity is what
+    the hash establishes. Bytes payloads — file contents handed over
+    programmatically, never the output of json.loads — are hashed as-is
+    with no canonicalization step at all.
+    """
+    if isinstance(payload, (bytes, bytearray, memoryview)):
+        return hashlib.sha256(payload).hexdigest()
+    if payload is None or isinstance(payload, (str, int, float, bool)):
+        return _hash_leaf(type(payload).__name__, payload)
+    return _hash_payload_direct(payload)
+
+
+def _scan_value_end(data: bytes, start: int) -> int:
+    """Return the index one past the JSON value starting at ``start``."""
+    first = data[start : start + 1]
+    if first == b'"':
+        index = start + 1
+        while True:
+            char = data[index : index + 1]
+            if char == b"\\":
+                index += 2
+                continue
+            if char == b'"':
+                return index + 1
+            index += 1
+    if first in (b"{", b"["):
+        depth = 0
+        in_string = False
+        index = start
+        while True:
+            char = data[index : index + 1]
+            if in_string:
+                if char == b"\\":
+                    index += 1
+                elif char == b'"':
+                    in_string = False
+            elif char == b'"':
+                in_string = True
+            elif char in (b"{", b"["):
+                depth += 1
+            elif char in (b"}", b"]"):
+                depth -= 1
+                if depth == 0:
+                    return index + 1
+            index += 1
+    # Number / true / false / null: runs to the next delimiter.
+    index = start
+    while data[index : index + 1] not in (b",", b"}", b"]", b""):
+        index += 1
+    return index
+
+
+def _iter_content_slices(data: bytes | mmap.mmap) -> list[bytes]:
+    """Slice each ``artifacts[i].content`` subtree out of the raw bytes.
+
+    A structural scan (strings, escapes, bracket depth) captures every
+    content value as its original byte span without building Python
+    objects, so producers that wrote canonical JSON can be verified by
+    hashing the file bytes directly.
+    """
+    key = b'"content"'
+    slices: list[bytes] = []
+    search = data.find(b'"artifacts"')
+    if search < 0:
+        return slices
+    index = data.find(key, search)
+    while index >= 0:
+        cursor = index + len(key)
+        while data[cursor : cursor + 1] in (b" ", b"\t", b"\r", b"\n", b":"):
+            cursor += 1
+        end = _scan_value_end(data, cursor)
+        slices.append(data[cursor:end])
+        index = data.find(key, end)
+    return slices
+
+
+def verify_hashes(
+    bundle: dict[str, Any], raw: bytes | mmap.mmap | None = None
+) -> list[dict[str, str]]:
+    """Recompute every artifact hash; returns one record per mismatch.
+
+    When the raw bundle bytes are supplied and the producer wrote
+    canonical JSON, hashes match the original byte slices directly and
+    the canonical re-encode is skipped entirely; non-canonical bundles
+    fall back to :func:`_hash_payload` per artifact.
+
+    Artifacts may also record ``content_length``, the byte length of
+    their canonical content. When the raw slice disagrees with the hint,
+    one canonical re-encode settles it: a length that still differs is a
+    certain mismatch reported without any digest work.
+    """
+    artifacts = bundle.get("artifacts", [])
+    slices: list[bytes] | None = None
+    if raw is not None:
+        candidates = _iter_content_slices(raw)
+        # Nested "content" keys inside payloads break the 1:1 pairing;
+        # only trust the slices when the counts line up.
+        if len(candidates) == len(artifacts):
+            slices = candidates
+    mismatches: list[dict[str, str]] = []
+    pending: list[dict[str, Any]] = []
+    for index, artifact in enumerate(artifacts):
+        # Normalize case once; producers are inconsistent about hex case
+        # and hexdigest() is lowercase.
+        stored_hash = artifact.get("hash", "").lower()
+        if slices is not None:
+            expected_length = artifact.get("content_length")
+            if expected_length is not None and len(slices[index]) != expected_length:
+                # The slice may simply be non-canonical formatting, so
+                # confirm against the canonical length before flagging;
+                # a confirmed mismatch never touches the hasher.
+                actual_length = _canonical_length(artifact.get("content"))
+                if actual_length != expected_length:
+                    mismatches.append(
+                        {
+                            "name": artifact.get("name", "<unnamed>"),
+                            "stored": stored_hash,
+                            "calculated": (
+                                f"(content_length {actual_length} "
+                                f"!= recorded {expected_length})"
+                            ),
+                        }
+                    )
+                else:
+                    pending.append(artifact)
+                continue
+            if hmac.compare_digest(
+                hashlib.sha256(slices[index]).hexdigest(), stored_hash
+            ):
+                continue
+        pending.append(artifact)
+    if len(pending) >= _PARALLEL_THRESHOLD:
+        # Per-artifact hashing is independent and encode-bound (the GIL is
+        # held inside the encoder), so large bundles fan out to processes.
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor() as executor:
+            calculated_hashes = list(
+                executor.map(
+                    _hash_payload,
+                    (artifact.get("content") for artifact in pending),
+                    chunksize=8,
+                )
+            )
+    else:
+        # Dedupe aliased payloads by object identity within this bundle;
+        # an id() lookup is free next to a full canonical encode.
+        seen: dict[int, str] = {}
+        calculated_hashes = []
+        for artifact in pending:
+            content = artifact.get("content")
+            digest = seen.get(id(content))
+            if digest is None:
+                digest = _hash_payload(content)
+                seen[id(content)] = digest
+            calculated_hashes.append(digest)
+    for artifact, calculated in zip(pending, calculated_hashes):
+        stored_hash = artifact.get("hash", "").lower()
+        # Constant-time comparison: an attacker who can tamper with a
+        # bundle should not be able to time their way to a prefix match.
+        if not hmac.compare_digest(calculated, stored_hash):
+            mismatches.append(
+                {
+                    "name": artifact.get("name", "<unnamed>"),
+                    "stored": stored_hash,
+                    "calculated": calculated,
+                }
+            )
+    return mismatches
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = _PARSER.parse_args(argv)
+
+    # Map the bundle instead of reading it: the parser and the raw-slice
+    # scan both consume the page cache directly, with no heap copy of
+    # the file bytes.
+    with args.bundle.open("rb") as handle, mmap.mmap(
+        handle.fileno(), 0, access=mmap.ACCESS_READ
+    ) as raw:
+        if orjson is not None:
+            view = memoryview(raw)
+            try:
+                bundle = orjson.loads(view)
+            finally:
+                view.release()
+        else:
+            # stdlib json needs a bytes object; this copy only happens
+            # when the accelerator is missing.
+            bundle = json.loads(bytes(raw))
+        mismatches = verify_hashes(bundle, raw)
+    artifact_count = len(bundle.get("artifacts", []))
+    if not mismatches:
+        print(f"{artifact_count} artifact hashes verified")
+        return 0
+    for mismatch in mismatches:
+        print(
+            f"hash mismatch for {mismatch['name']}: "
+            f"stored {mismatch['stored']} != calculated {mismatch['calculated']}"
+        )
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
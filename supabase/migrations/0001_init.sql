@@ -0,0 +1,211 @@
+-- Consolidated Supabase schema for the AI employee scaffold.
+-- The repo keeps a single migration: edit the relevant section of this file
+-- directly instead of generating new migration files.
+
+create extension if not exists "vector";
+
+-- Write-behind mission session snapshots (agent/services/supabase_session.py).
+create table if not exists mission_sessions (
+    session_key text primary key,
+    state_snapshot jsonb not null default '{}'::jsonb,
+    updated_at timestamptz not null default now()
+);
+
+-- Field-level planner edit telemetry (scripts/analyze_edit_rates.py).
+create table if not exists mission_metadata (
+    id bigint generated always as identity primary key,
+    mission_id text not null,
+    persona text,
+    field text not null,
+    accepted boolean not null default false,
+    edited boolean not null default false,
+    regenerated boolean not null default false,
+    confidence double precision,
+    created_at timestamptz not null default now()
+);
+
+create index if not exists mission_metadata_mission_field_idx
+    on mission_metadata (mission_id, field, created_at);
+
+-- CopilotKit transcript rows subject to retention (scripts/check_retention.py).
+create table if not exists copilot_messages (
+    id bigint generated always as identity primary key,
+    tenant_id text,
+    session_key text not null,
+    role text not null,
+    content jsonb not null default '{}'::jsonb,
+    created_at timestamptz not null default now(),
+    soft_deleted_at timestamptz
+);
+
+-- Partial index covering the stale-row probe: only live rows are indexed.
+create index if not exists copilot_messages_stale_idx
+    on copilot_messages (created_at)
+    where soft_deleted_at is null;
+
+-- Retention cleanup invoked by scripts/check_retention.py --cleanup.
+-- Deletes in bounded batches so a backlog never holds one long transaction.
+create or replace function cleanup_copilot_messages(
+    retention_days int,
+    batch_size int default 5000,
+    max_batches int default 1
+)
+returns bigint
+language plpgsql
+volatile
+as $$
+declare
+    total bigint := 0;
+    batch bigint;
+begin
+    for i in 1..max_batches loop
+        delete from copilot_messages
+        where id in (
+            select id from copilot_messages
+            where created_at < now() - make_interval(days => retention_days)
+            limit batch_size
+        );
+        get diagnostics batch = row_count;
+        total := total + batch;
+        exit when batch < batch_size;
+    end loop;
+    return total;
+end;
+$$;
+
+-- Safeguard chip suggestions surfaced during planning.
+create table if not exists safeguard_hints (
+    id bigint generated always as identity primary key,
+    mission_id text not null,
+    hint text not null,
+    accepted boolean not null default false,
+    created_at timestamptz not null default now()
+);
+
+-- Mission lifecycle telemetry (scripts/audit_telemetry_events.py).
+create table if not exists mission_events (
+    id bigint generated always as identity primary key,
+    tenant_id text,
+    mission_id text,
+    event_name text not null,
+    payload jsonb not null default '{}'::jsonb,
+    created_at timestamptz not null default now()
+);
+
+-- Matches the audit's filter (tenant + created_at window) and keyset sort,
+-- turning the coverage scan into an index range scan.
+create index if not exists mission_events_audit_idx
+    on mission_events (tenant_id, created_at, event_name);
+
+-- Coverage counts for the telemetry audit: one roundtrip returns
+-- O(#distinct event names) rows instead of every raw event.
+create or replace function mission_events_required_coverage(
+    cutoff timestamptz,
+    tenant text default null,
+    mission text default null,
+    required text[] default '{}'
+)
+returns table (event_name text, cnt bigint)
+language sql
+stable
+as $$
+    select e.event_name, count(*)
+    from mission_events e
+    where e.created_at >= cutoff
+      and (tenant is null or e.tenant_id = tenant)
+      and (mission is null or e.mission_id = mission)
+      and e.event_name = any(required)
+    group by e.event_name
+$$;
+
+-- Planner latency telemetry (scripts/validate_planner_metrics.py).
+create table if not exists planner_runs (
+    id bigint generated always as identity primary key,
+    tenant_id text,
+    mission_id text,
+    latency_ms double precision not null,
+    created_at timestamptz not null default now()
+);
+
+create index if not exists planner_runs_window_idx
+    on planner_runs (created_at);
+
+-- Latency gate scalar for scripts/validate_planner_metrics.py: the
+-- percentile runs in the engine instead of shipping raw rows.
+create or replace function planner_latency_p95(window_minutes int default 60)
+returns double precision
+language sql
+stable
+as $$
+    select percentile_cont(0.95) within group (order by latency_ms)
+    from planner_runs
+    where created_at > now() - make_interval(mins => window_minutes);
+$$;
+
+-- Curated play catalog with pgvector embeddings (scripts/seed_library.py).
+create table if not exists library_entries (
+    id uuid primary key,
+    tenant_id text not null,
+    title text not null,
+    description text not null,
+    persona text not null,
+    confidence_score double precision not null default 0,
+    embedding vector(1536),
+    metadata jsonb not null default '{}'::jsonb,
+    created_at timestamptz not null default now()
+);
+
+-- Row level security: service-role keys bypass RLS, so enabling it here
+-- locks anonymous/authenticated access down to explicit policies.
+alter table mission_sessions enable row level security;
+alter table copilot_messages enable row level security;
+alter table mission_events enable row level security;
+alter table mission_metadata enable row level security;
+alter table safeguard_hints enable row level security;
+alter table library_entries enable row level security;
+alter table planner_runs enable row level security;
+
+-- Server-side aggregation for the Gate G-B edit-rate analysis: ships
+-- per-field aggregates instead of raw rows.
+create or replace function analyze_edit_rates_agg()
+returns table (
+    field text,
+    total bigint,
+    accepted bigint,
+    edited bigint,
+    regenerated bigint,
+    avg_conf double precision
+)
+language sql
+stable
+as $$
+    with latest as (
+        select distinct on (mission_id, field)
+            mission_id,
+            field,
+            accepted as last_accepted,
+            coalesce(confidence, 0) as last_confidence
+        from mission_metadata
+        order by mission_id, field, created_at desc
+    ),
+    per_group as (
+        select
+            mission_id,
+            field,
+            bool_or(edited) as edited,
+            count(*) filter (where regenerated) as regenerated
+        from mission_metadata
+        group by mission_id, field
+    )
+    select
+        g.field,
+        count(*)::bigint as total,
+        count(*) filter (where l.last_accepted)::bigint as accepted,
+        count(*) filter (where g.edited)::bigint as edited,
+        coalesce(sum(g.regenerated), 0)::bigint as regenerated,
+        avg(l.last_confidence)::double precision as avg_conf
+    from per_group g
+    join latest l using (mission_id, field)
+    group by g.field
+    order by g.field;
+$$;